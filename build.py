@@ -8,10 +8,28 @@ import shutil
 from pathlib import Path
 
 
-def clean_build():
-    """Clean previous build artifacts."""
+# Modules left out of the bundle
+EXCLUDED_MODULES = [
+    'torch',
+    'scipy',
+    'matplotlib',
+    'tkinter',
+    'tests',
+    'numpy.distutils',
+]
+
+
+def clean_build(fresh=False):
+    """Clean previous build artifacts.
+
+    Args:
+        fresh: Also remove PyInstaller's build/ work directory, discarding
+            its analysis cache
+    """
     print("Cleaning previous builds...")
-    dirs_to_clean = ['build', 'dist']
+    dirs_to_clean = ['dist']
+    if fresh:
+        dirs_to_clean.insert(0, 'build')
 
     for dir_name in dirs_to_clean:
         if os.path.exists(dir_name):
@@ -19,14 +37,23 @@ def clean_build():
             print(f"  Removed {dir_name}/")
 
 
-def build_executable(mode='tray'):
-    """Build executable with PyInstaller.
+def build_command(mode='tray', bundle=None, fresh=False, optimize=True):
+    """Assemble the PyInstaller command line for one executable.
 
     Args:
         mode: 'tray' for system tray mode, 'gui' for traditional GUI mode
+        bundle: 'onedir' or 'onefile' (defaults to onedir for tray mode,
+            onefile for GUI mode)
+        fresh: Discard PyInstaller's analysis cache (--clean)
+        optimize: Whether the build runs with PYTHONOPTIMIZE=2
+
+    Returns:
+        Tuple of (name, bundle, argv list)
     """
+    if bundle is None:
+        bundle = 'onedir' if mode == 'tray' else 'onefile'
+
     system = platform.system()
-    print(f"\nBuilding FileSeekr for {system} ({mode} mode)...")
 
     # Determine script to build
     if mode == 'tray':
@@ -39,29 +66,27 @@ def build_executable(mode='tray'):
     # Base PyInstaller arguments
     args = [
         'pyinstaller',
-        '--clean',
+        '--clean' if fresh else '',  # Keep the analysis cache for incremental builds
         '--noconfirm',
+        '--noupx',  # UPX decompression dominates launch time
+        f'--{bundle}',
         f'--name={name}',
+        # Optimized and unoptimized bytecode must not share a build cache
+        '' if optimize else '--workpath=build/no-optimize',
     ]
 
     # Platform-specific arguments
     if system == 'Windows':
         args.extend([
             '--windowed',  # No console window
-            '--onefile',
             '--icon=assets/icon.ico' if os.path.exists('assets/icon.ico') else '',
         ])
     elif system == 'Darwin':  # macOS
         args.extend([
             '--windowed',
-            '--onefile',
             '--osx-bundle-identifier=com.fileseekr.app',
             '--icon=assets/icon.icns' if os.path.exists('assets/icon.icns') else '',
         ])
-    else:  # Linux
-        args.extend([
-            '--onefile',
-        ])
 
     # Add data files
     args.extend([
@@ -78,30 +103,94 @@ def build_executable(mode='tray'):
         '--hidden-import=yaml',
     ])
 
+    # Heavy optional packages pulled in transitively (mostly via spaCy)
+    # that FileSeekr never imports
+    args.extend(f'--exclude-module={module}' for module in EXCLUDED_MODULES)
+
     # Add script
     args.append(script)
 
     # Remove empty strings
     args = [arg for arg in args if arg]
 
-    # Run PyInstaller
-    print(f"\nRunning PyInstaller...")
-    print(f"Command: {' '.join(args)}\n")
+    return name, bundle, args
+
+
+def run_builds(builds, jobs=1, optimize=True):
+    """Run PyInstaller builds, up to `jobs` at a time.
+
+    Args:
+        builds: List of (name, bundle, argv) tuples from build_command
+        jobs: Maximum number of concurrent PyInstaller processes
+        optimize: Run PyInstaller with PYTHONOPTIMIZE=2 so frozen modules
+            are compiled without asserts and docstrings
+
+    Returns:
+        True if every build succeeded
+    """
+    env = None
+    if optimize:
+        env = {**os.environ, 'PYTHONOPTIMIZE': '2'}
+        print("\nNote: building with PYTHONOPTIMIZE=2; asserts and docstrings "
+              "are stripped from the bundle (use --no-optimize to keep them).")
+
+    jobs = max(1, jobs)
+    pending = list(builds)
+    running = []
+    success = True
+
+    while pending or running:
+        # Launch as many builds as the job limit allows
+        while pending and len(running) < jobs:
+            name, bundle, args = pending.pop(0)
+            print(f"\nRunning PyInstaller for {name} ({bundle})...")
+            print(f"Command: {' '.join(args)}\n")
+            try:
+                running.append((name, bundle, subprocess.Popen(args, env=env)))
+            except OSError as e:
+                print(f"\n✗ Build failed: {e}")
+                success = False
+
+        if not running:
+            continue
+
+        # Wait for the oldest build to finish
+        name, bundle, process = running.pop(0)
+        if process.wait() == 0:
+            print(f"\n✓ Build successful!")
+            if bundle == 'onedir':
+                print(f"Executable created in: dist/{name}/{name}")
+            else:
+                print(f"Executable created in: dist/{name}")
+        else:
+            print(f"\n✗ Build of {name} failed with exit code {process.returncode}")
+            success = False
+
+    return success
+
+
+def build_executable(mode='tray', bundle=None, fresh=False, optimize=True):
+    """Build executable with PyInstaller.
 
-    try:
-        subprocess.run(args, check=True)
-        print(f"\n✓ Build successful!")
-        print(f"Executable created in: dist/{name}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"\n✗ Build failed: {e}")
-        return False
+    Args:
+        mode: 'tray' for system tray mode, 'gui' for traditional GUI mode
+        bundle: 'onedir' or 'onefile' (defaults to onedir for tray mode,
+            onefile for GUI mode)
+        fresh: Discard PyInstaller's analysis cache (--clean)
+        optimize: Strip asserts and docstrings (PYTHONOPTIMIZE=2)
+    """
+    print(f"\nBuilding FileSeekr for {platform.system()} ({mode} mode)...")
+    return run_builds([build_command(mode, bundle, fresh, optimize)], optimize=optimize)
 
 
 def create_installer():
     """Create platform-specific installer."""
     system = platform.system()
 
+    print("\nBundle layout:")
+    print("  onedir  - starts fastest; ship the whole dist/<name>/ folder")
+    print("  onefile - single file, but unpacks itself to a temp dir on every launch")
+
     if system == 'Windows':
         print("\nTo create Windows installer:")
         print("1. Install NSIS: https://nsis.sourceforge.io/")
@@ -127,11 +216,33 @@ def main():
         default='tray',
         help='Build mode: tray (system tray), gui (traditional), or both'
     )
+    parser.add_argument(
+        '--bundle',
+        choices=['onefile', 'onedir'],
+        default=None,
+        help='Bundle layout (default: onedir for tray, onefile for gui)'
+    )
     parser.add_argument(
         '--no-clean',
         action='store_true',
         help='Skip cleaning previous builds'
     )
+    parser.add_argument(
+        '--fresh',
+        action='store_true',
+        help='Discard cached build analysis and rebuild from scratch'
+    )
+    parser.add_argument(
+        '--no-optimize',
+        action='store_true',
+        help='Keep asserts and docstrings in the bundled bytecode'
+    )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=2,
+        help='Number of builds to run in parallel with --mode=both (max 2)'
+    )
     parser.add_argument(
         '--installer',
         action='store_true',
@@ -146,15 +257,22 @@ def main():
 
     # Clean build
     if not args.no_clean:
-        clean_build()
+        clean_build(args.fresh)
 
     # Build
     if args.mode == 'both':
-        success1 = build_executable('tray')
-        success2 = build_executable('gui')
-        success = success1 and success2
+        print(f"\nBuilding FileSeekr for {platform.system()} (tray and gui modes)...")
+        optimize = not args.no_optimize
+        success = run_builds(
+            [
+                build_command('tray', args.bundle, args.fresh, optimize),
+                build_command('gui', args.bundle, args.fresh, optimize),
+            ],
+            jobs=min(args.jobs, 2),
+            optimize=optimize
+        )
     else:
-        success = build_executable(args.mode)
+        success = build_executable(args.mode, args.bundle, args.fresh, not args.no_optimize)
 
     if success and args.installer:
         create_installer()
@@ -21,7 +21,14 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        'torch',
+        'scipy',
+        'matplotlib',
+        'tkinter',
+        'tests',
+        'numpy.distutils',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -55,6 +62,6 @@ coll = COLLECT(
     a.datas,
     strip=False,
     upx=True,
-    upx_exclude=[],
+    upx_exclude=['Qt*', 'libQt5*', 'Qt5*.dll'],  # Compressed Qt libraries load slower
     name='fileseekr',
 )
@@ -6,6 +6,7 @@ fast indexing, and an intuitive GUI.
 """
 import sys
 import os
+import multiprocessing
 from pathlib import Path
 
 # Add src to path
@@ -56,4 +57,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Worker processes re-enter the frozen executable; let them run their task
+    multiprocessing.freeze_support()
     main()
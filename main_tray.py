@@ -6,13 +6,14 @@ Press Ctrl+Shift+Space to search files from anywhere.
 """
 import sys
 import os
+import multiprocessing
 from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from PyQt5.QtWidgets import QApplication, QMessageBox
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 import argparse
 
 from src.app_controller import AppController
@@ -20,55 +21,7 @@ from src.gui.overlay_window import OverlaySearchWindow
 from src.gui.system_tray import SystemTrayApp
 from src.utils.hotkey_manager import HotkeyManager
 from src.utils.autostart import AutoStartManager
-
-
-def check_single_instance():
-    """Check if another instance is already running.
-
-    Returns:
-        True if this is the only instance
-    """
-    # Simple lock file approach
-    lock_file = Path.home() / '.fileseekr.lock'
-
-    if lock_file.exists():
-        try:
-            # Check if process is still running
-            with open(lock_file, 'r') as f:
-                pid = int(f.read().strip())
-
-            # Try to check if process exists (Unix-like systems)
-            try:
-                os.kill(pid, 0)
-                # Process exists
-                return False
-            except (OSError, ProcessLookupError):
-                # Process doesn't exist, remove stale lock
-                lock_file.unlink()
-        except Exception:
-            # Error reading lock, remove it
-            try:
-                lock_file.unlink()
-            except Exception:
-                pass
-
-    # Create lock file
-    try:
-        with open(lock_file, 'w') as f:
-            f.write(str(os.getpid()))
-        return True
-    except Exception:
-        return True  # Allow running if we can't create lock
-
-
-def cleanup_lock():
-    """Remove lock file on exit."""
-    lock_file = Path.home() / '.fileseekr.lock'
-    try:
-        if lock_file.exists():
-            lock_file.unlink()
-    except Exception:
-        pass
+from src.utils.single_instance import SingleInstance
 
 
 def main():
@@ -111,13 +64,6 @@ def main():
                 print("✗ Failed to disable auto-start")
                 return 1
 
-    # Check for single instance (only in tray mode)
-    if not args.no_tray:
-        if not check_single_instance():
-            print("FileSeekr is already running in the system tray.")
-            print("Press Ctrl+Shift+Space to search, or check the system tray icon.")
-            return 1
-
     # Enable High DPI scaling
     QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
@@ -128,6 +74,18 @@ def main():
     app.setOrganizationName("FileSeekr")
     app.setQuitOnLastWindowClosed(False)  # Keep running in tray
 
+    # Check for single instance (only in tray mode)
+    instance = None
+    if not args.no_tray:
+        instance = SingleInstance()
+        if not instance.acquire():
+            if instance.notify_running():
+                print("FileSeekr is already running; showing its search window.")
+            else:
+                print("FileSeekr is already running in the system tray.")
+                print("Press Ctrl+Shift+Space to search, or check the system tray icon.")
+            return 1
+
     # Set application style
     app.setStyle('Fusion')
 
@@ -163,6 +121,9 @@ def main():
             # Create system tray app
             tray_app = SystemTrayApp(controller, overlay_window, hotkey_manager)
 
+            # Let later launches bring up the overlay instead of exiting silently
+            instance.listen(overlay_window.show_overlay)
+
             # Start hotkey listener
             hotkey_manager.start()
 
@@ -170,18 +131,21 @@ def main():
             print("Press Ctrl+Shift+Space to search files.")
             print("Right-click the tray icon for more options.")
 
+            # Load spaCy once the event loop is running
+            QTimer.singleShot(0, controller.preload_nlp_in_background)
+
             # Run application
             exit_code = app.exec_()
 
             # Cleanup
-            cleanup_lock()
+            instance.release()
             hotkey_manager.stop()
             controller.shutdown()
 
             sys.exit(exit_code)
 
         except Exception as e:
-            cleanup_lock()
+            instance.release()
             QMessageBox.critical(
                 None,
                 "FileSeekr Error",
@@ -195,4 +159,6 @@ def main():
 
 
 if __name__ == '__main__':
+    # Worker processes re-enter the frozen executable; let them run their task
+    multiprocessing.freeze_support()
     sys.exit(main())
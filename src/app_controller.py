@@ -1,17 +1,24 @@
 """Main application controller."""
+import threading
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
 from .utils.config_manager import ConfigManager
 from .core.indexer import FileIndexer
 from .core.search_engine import SearchEngine
-from .core.nlp_parser import NLPQueryParser
-from .core.file_watcher import FileWatcher
 
 
 class AppController:
     """Main application controller coordinating all components."""
 
+    # Configuration keys the file watcher follows
+    _WATCHER_KEYS = frozenset({
+        'index.watch_for_changes',
+        'indexing.watch_paths',
+        'index.excluded_dirs',
+        'index.excluded_extensions',
+    })
+
     def __init__(self, config_path: str = 'config.yaml'):
         """Initialize application controller.
 
@@ -25,15 +32,51 @@ class AppController:
         index_path = self.config.get('index.index_path', 'data/index')
         self.indexer = FileIndexer(index_path, self.config)
         self.search_engine = SearchEngine(self.indexer, self.config)
-        self.nlp_parser = NLPQueryParser()
 
-        # Initialize file watcher
+        # NLP parser (spaCy) is created on first use; see nlp_parser
+        self._nlp_parser = None
+        self._nlp_lock = threading.Lock()
+
+        # Initialize file watcher; later reconfiguration runs on a worker
+        # thread and is serialized by _watcher_lock
         self.file_watcher = None
+        self._watcher_lock = threading.Lock()
+        self._watcher_thread = None
+        self._shut_down = False
         if self.config.get('index.watch_for_changes', True):
             self._init_file_watcher()
 
+        self.config.add_listener(self._on_config_changed)
+
+    @property
+    def nlp_parser(self):
+        """NLP query parser, loaded on first access.
+
+        Returns:
+            NLPQueryParser instance
+        """
+        if self._nlp_parser is None:
+            with self._nlp_lock:
+                if self._nlp_parser is None:
+                    from .core.nlp_parser import NLPQueryParser
+                    self._nlp_parser = NLPQueryParser()
+        return self._nlp_parser
+
+    def preload_nlp(self):
+        """Load the NLP parser and its spaCy model ahead of the first search.
+
+        Safe to call from a worker thread.
+        """
+        self.nlp_parser.nlp
+
+    def preload_nlp_in_background(self):
+        """Start loading the NLP parser on a daemon thread."""
+        threading.Thread(target=self.preload_nlp, daemon=True).start()
+
     def _init_file_watcher(self):
         """Initialize file watcher."""
+        from .core.file_watcher import FileWatcher
+
         self.file_watcher = FileWatcher(
             self.indexer,
             self.config,
@@ -59,11 +102,71 @@ class AppController:
         """
         print(f"File {action}: {file_path}")
 
+    def _on_config_changed(self, changed: set):
+        """Push configuration changes to components that cache settings.
+
+        Args:
+            changed: Set of changed key paths
+        """
+        if changed & self._WATCHER_KEYS:
+            # Starting, stopping and scanning new roots can take seconds;
+            # keep it off the thread that saved the settings
+            self._watcher_thread = threading.Thread(
+                target=self._reconfigure_watcher, args=(changed,), daemon=True
+            )
+            self._watcher_thread.start()
+
+    def _reconfigure_watcher(self, changed: set):
+        """Apply configuration changes to the file watcher.
+
+        Reads the current configuration rather than the changed values, so
+        concurrent runs leave the watcher matching the latest settings.
+
+        Args:
+            changed: Set of changed key paths
+        """
+        with self._watcher_lock:
+            if self._shut_down:
+                return
+
+            # Written by the settings dialog
+            if 'index.watch_for_changes' in changed:
+                if self.config.get('index.watch_for_changes', True):
+                    if self.file_watcher is None:
+                        self._init_file_watcher()
+                elif self.file_watcher is not None:
+                    self.file_watcher.stop()
+                    self.file_watcher = None
+
+            if self.file_watcher and 'indexing.watch_paths' in changed:
+                self._sync_watch_paths()
+
+            # Only set by hand-edited or programmatic updates
+            if self.file_watcher and (
+                'index.excluded_dirs' in changed or 'index.excluded_extensions' in changed
+            ):
+                self.file_watcher.reload_exclusions()
+
+    def _sync_watch_paths(self):
+        """Make the file watcher follow the configured watch paths."""
+        wanted = {
+            Path(path) for path in self.config.get('indexing.watch_paths', [])
+            if Path(path).exists()
+        }
+        for path in self.file_watcher.watch_paths - wanted:
+            self.file_watcher.remove_watch_path(str(path))
+        for path in wanted - self.file_watcher.watch_paths:
+            self.file_watcher.add_watch_path(str(path))
+
+        if wanted and not self.file_watcher.running:
+            self.file_watcher.start()
+
     def search(
         self,
         query: str,
         filters: Optional[Dict[str, Any]] = None,
-        use_nlp: bool = True
+        use_nlp: bool = True,
+        max_results: Optional[int] = None
     ) -> List:
         """Perform search.
 
@@ -71,6 +174,7 @@ class AppController:
             query: Search query
             filters: Optional filters
             use_nlp: Whether to use NLP parsing
+            max_results: Maximum number of results (defaults to config)
 
         Returns:
             List of search results
@@ -92,7 +196,9 @@ class AppController:
             search_query = query
 
         # Perform search
-        results = self.search_engine.search(search_query, filters=filters)
+        results = self.search_engine.search(
+            search_query, max_results=max_results, filters=filters
+        )
 
         return results
 
@@ -171,5 +277,8 @@ class AppController:
 
     def shutdown(self):
         """Shutdown application and cleanup."""
-        if self.file_watcher:
-            self.file_watcher.stop()
+        with self._watcher_lock:
+            self._shut_down = True
+            if self.file_watcher:
+                self.file_watcher.stop()
+        self.search_engine.close()
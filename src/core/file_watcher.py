@@ -1,16 +1,77 @@
 """File system watcher for real-time index updates."""
 import os
+import sys
 import time
 import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Set, Callable, Optional, List
-from queue import Queue, Empty
+from collections import deque
 from datetime import datetime
 
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # pragma: no cover - optional dependency
+    Observer = None
+    FileSystemEventHandler = object
+
+
+def _suffix(name: str) -> str:
+    """Return the extension of a file name, matching ``Path.suffix``.
+
+    Args:
+        name: File name (no directory part)
+
+    Returns:
+        Extension including the leading dot, or an empty string
+    """
+    dot = name.rfind('.')
+    return name[dot:] if dot > 0 else ''
+
+
+class _WatchEventHandler(FileSystemEventHandler):
+    """Forwards native file system events to the watcher's update queue."""
+
+    def __init__(self, watcher):
+        """Initialize event handler.
+
+        Args:
+            watcher: FileWatcher instance receiving the events
+        """
+        super().__init__()
+        self.watcher = watcher
+
+    def on_created(self, event):
+        """Queue newly created files."""
+        if not event.is_directory:
+            self.watcher._queue_event('add', event.src_path)
+
+    def on_modified(self, event):
+        """Queue modified files."""
+        if not event.is_directory:
+            self.watcher._queue_event('modify', event.src_path)
+
+    def on_deleted(self, event):
+        """Queue deleted files."""
+        if not event.is_directory:
+            self.watcher._queue_event('delete', event.src_path)
+
+    def on_moved(self, event):
+        """Queue a rename as a delete of the old path plus an add of the new one."""
+        if not event.is_directory:
+            self.watcher._queue_event('delete', event.src_path)
+            self.watcher._queue_event('add', event.dest_path)
+
 
 class FileWatcher:
     """Watches file system for changes and updates index."""
 
+    # Batches smaller than this are read in the update thread; process
+    # start-up and pickling would cost more than they save
+    POOL_MIN_BATCH = 8
+
     def __init__(self, indexer, config_manager, update_callback: Optional[Callable] = None):
         """Initialize file watcher.
 
@@ -26,12 +87,32 @@ class FileWatcher:
         self.watch_paths: Set[Path] = set()
         self.running = False
         self.thread = None
-        self.file_cache: dict = {}  # path -> (mtime, size)
-        self.update_queue = Queue()
+        # Polling fallback only: dir -> {filename: (mtime_ns, size)}; directory
+        # strings are interned so every file in a folder shares one key object
+        self.file_cache: dict = {}
+        # Single-producer/single-consumer event pipeline
+        self._events = deque()
+        self._event_ready = threading.Event()
+
+        # Native change notifications when watchdog is available,
+        # otherwise fall back to polling
+        self.use_native = Observer is not None
+        self.observer = None
+        self._watches: dict = {}  # path -> watchdog ObservedWatch
+
+        # Worker processes that read file contents for large batches
+        self._pool: Optional[ProcessPoolExecutor] = None
 
         # Polling interval (seconds)
         self.poll_interval = 5
 
+        self.reload_exclusions()
+
+    def reload_exclusions(self) -> None:
+        """Re-read excluded directories and extensions from the configuration."""
+        self._excluded_dirs = frozenset(self.config.get('index.excluded_dirs', []))
+        self._excluded_exts = frozenset(self.config.get('index.excluded_extensions', []))
+
     def add_watch_path(self, path: str) -> None:
         """Add a path to watch.
 
@@ -41,8 +122,13 @@ class FileWatcher:
         path_obj = Path(path)
         if path_obj.exists():
             self.watch_paths.add(path_obj)
-            # Initialize cache for this path
-            self._cache_directory(path_obj)
+            if self.use_native:
+                # The kernel tracks state for us; just subscribe if running
+                if self.observer is not None:
+                    self._schedule(path_obj)
+            else:
+                # Initialize cache for this path
+                self._cache_directory(path_obj)
 
     def remove_watch_path(self, path: str) -> None:
         """Remove a path from watch list.
@@ -53,14 +139,24 @@ class FileWatcher:
         path_obj = Path(path)
         self.watch_paths.discard(path_obj)
 
+        watch = self._watches.pop(path_obj, None)
+        if watch is not None and self.observer is not None:
+            self.observer.unschedule(watch)
+
     def start(self) -> None:
         """Start watching for changes."""
         if self.running:
             return
 
         self.running = True
-        self.thread = threading.Thread(target=self._watch_loop, daemon=True)
-        self.thread.start()
+        if self.use_native:
+            self.observer = Observer()
+            for watch_path in list(self.watch_paths):
+                self._schedule(watch_path)
+            self.observer.start()
+        else:
+            self.thread = threading.Thread(target=self._watch_loop, daemon=True)
+            self.thread.start()
 
         # Start update processor
         self.update_thread = threading.Thread(target=self._process_updates, daemon=True)
@@ -69,39 +165,93 @@ class FileWatcher:
     def stop(self) -> None:
         """Stop watching."""
         self.running = False
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join(timeout=2)
+            self.observer = None
+            self._watches.clear()
         if self.thread:
             self.thread.join(timeout=2)
         if hasattr(self, 'update_thread'):
             self.update_thread.join(timeout=2)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
 
-    def _watch_loop(self) -> None:
-        """Main watch loop (runs in separate thread)."""
-        excluded_dirs = set(self.config.get('index.excluded_dirs', []))
-        excluded_exts = set(self.config.get('index.excluded_extensions', []))
+    def _schedule(self, watch_path: Path) -> None:
+        """Subscribe to native change notifications for a path.
+
+        Args:
+            watch_path: Directory to watch recursively
+        """
+        if watch_path in self._watches:
+            return
+        try:
+            self._watches[watch_path] = self.observer.schedule(
+                _WatchEventHandler(self), str(watch_path), recursive=True
+            )
+        except OSError as e:
+            print(f"Error watching {watch_path}: {e}")
 
+    def _queue_event(self, action: str, path: str) -> None:
+        """Queue a native file system event, honouring exclusions.
+
+        Args:
+            action: Update action (add, modify, delete)
+            path: Path reported by the observer
+        """
+        file_path = Path(path)
+
+        if _suffix(file_path.name) in self._excluded_exts:
+            return
+
+        if self._in_excluded_dir(file_path):
+            return
+
+        self._push((action, file_path))
+
+    def _in_excluded_dir(self, file_path: Path) -> bool:
+        """Check whether a file lies in an excluded directory below its watch root.
+
+        Only the directories between the watch root and the file count, as
+        in the polling and indexing walks; a root that itself sits under a
+        directory named like an exclusion is still watched.
+
+        Args:
+            file_path: Path reported by the observer
+
+        Returns:
+            True if the file should be ignored
+        """
+        relative = None
+        for root in list(self.watch_paths):
+            try:
+                parts = file_path.parent.relative_to(root).parts
+            except ValueError:
+                continue
+            # With nested roots, the innermost one decides
+            if relative is None or len(parts) < len(relative):
+                relative = parts
+
+        if relative is None:
+            return False
+        return not self._excluded_dirs.isdisjoint(relative)
+
+    def _watch_loop(self) -> None:
+        """Polling watch loop, used when native notifications are unavailable."""
         while self.running:
             try:
                 for watch_path in list(self.watch_paths):
-                    if not watch_path.exists():
+                    root = str(watch_path)
+                    if not os.path.isdir(root):
                         continue
 
                     # Walk directory and check for changes
-                    for root, dirs, files in os.walk(watch_path):
-                        # Filter excluded directories
-                        dirs[:] = [d for d in dirs if d not in excluded_dirs]
-
-                        for filename in files:
-                            if not self.running:
-                                return
-
-                            file_path = Path(root) / filename
+                    for entry in self._scan_files(root):
+                        if not self.running:
+                            return
 
-                            # Skip excluded extensions
-                            if file_path.suffix in excluded_exts:
-                                continue
-
-                            # Check for changes
-                            self._check_file(file_path)
+                        self._check_file(entry)
 
                 # Sleep before next poll
                 time.sleep(self.poll_interval)
@@ -110,93 +260,224 @@ class FileWatcher:
                 print(f"Error in watch loop: {e}")
                 time.sleep(self.poll_interval)
 
-    def _check_file(self, file_path: Path) -> None:
+    def _scan_files(self, root: str):
+        """Yield file entries below a directory.
+
+        Walks an explicit stack of os.scandir calls rather than recursing,
+        classifying entries from the type bits returned by the directory
+        read so excluded directories are pruned without an extra stat.
+
+        Args:
+            root: Directory to scan
+
+        Yields:
+            os.DirEntry for each non-excluded file
+        """
+        excluded_dirs = self._excluded_dirs
+        excluded_exts = self._excluded_exts
+        stack = [root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in excluded_dirs:
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            if _suffix(name) not in excluded_exts:
+                                yield entry
+            except (OSError, PermissionError):
+                continue
+
+    def _check_file(self, entry: os.DirEntry) -> None:
         """Check if file has changed.
 
         Args:
-            file_path: Path to check
+            entry: Directory entry of the file to check
         """
+        name = entry.name
+        files = self.file_cache.setdefault(sys.intern(os.path.dirname(entry.path)), {})
         try:
-            stat = file_path.stat()
-            mtime = stat.st_mtime
-            size = stat.st_size
+            stat = entry.stat(follow_symlinks=False)
+            state = (stat.st_mtime_ns, stat.st_size)
 
-            path_str = str(file_path)
-            cached = self.file_cache.get(path_str)
+            cached = files.get(name)
 
             if cached is None:
                 # New file
-                self.update_queue.put(('add', file_path))
-                self.file_cache[path_str] = (mtime, size)
+                self._push(('add', Path(entry.path)))
+                files[name] = state
 
-            elif cached != (mtime, size):
+            elif cached != state:
                 # Modified file
-                self.update_queue.put(('modify', file_path))
-                self.file_cache[path_str] = (mtime, size)
+                self._push(('modify', Path(entry.path)))
+                files[name] = state
 
         except (OSError, PermissionError):
             # File might have been deleted
-            path_str = str(file_path)
-            if path_str in self.file_cache:
-                self.update_queue.put(('delete', file_path))
-                del self.file_cache[path_str]
+            if name in files:
+                self._push(('delete', Path(entry.path)))
+                del files[name]
 
     def _cache_directory(self, directory: Path) -> None:
         """Build initial cache for a directory.
 
+        Top-level subdirectories are scanned concurrently; the work is
+        dominated by stat latency rather than CPU, so threads overlap well.
+
         Args:
             directory: Directory to cache
         """
-        excluded_dirs = set(self.config.get('index.excluded_dirs', []))
-        excluded_exts = set(self.config.get('index.excluded_extensions', []))
+        excluded_dirs = self._excluded_dirs
+        excluded_exts = self._excluded_exts
 
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in excluded_dirs]
+        def cache_entries(entries) -> dict:
+            cache = {}
+            for entry in entries:
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                except (OSError, PermissionError):
+                    continue
+                directory = sys.intern(os.path.dirname(entry.path))
+                files = cache.get(directory)
+                if files is None:
+                    files = cache[directory] = {}
+                files[entry.name] = (stat.st_mtime_ns, stat.st_size)
+            return cache
+
+        def cache_subdir(path: str) -> dict:
+            return cache_entries(self._scan_files(path))
+
+        top_files = []
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in excluded_dirs:
+                            subdirs.append(entry.path)
+                    elif entry.is_file() and _suffix(entry.name) not in excluded_exts:
+                        top_files.append(entry)
+        except (OSError, PermissionError):
+            return
 
-            for filename in files:
-                file_path = Path(root) / filename
+        self.file_cache.update(cache_entries(top_files))
 
-                if file_path.suffix in excluded_exts:
-                    continue
+        if not subdirs:
+            return
 
-                try:
-                    stat = file_path.stat()
-                    self.file_cache[str(file_path)] = (stat.st_mtime, stat.st_size)
-                except (OSError, PermissionError):
-                    pass
+        workers = min(32, (os.cpu_count() or 1) * 4, len(subdirs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(cache_subdir, subdir) for subdir in subdirs]
+            for future in as_completed(futures):
+                # Workers cover disjoint directories; dict.update is atomic under the GIL
+                self.file_cache.update(future.result())
+
+    def _push(self, item: tuple) -> None:
+        """Hand an (action, file_path) update to the processing thread.
+
+        Args:
+            item: Update tuple
+        """
+        self._events.append(item)
+        self._event_ready.set()
 
     def _process_updates(self) -> None:
-        """Process queued updates (runs in separate thread)."""
+        """Process queued updates in debounced batches (runs in separate thread)."""
+        max_batch = self.config.get('index.watch_batch.max_batch', 256)
+        debounce = self.config.get('index.watch_batch.debounce_ms', 500) / 1000.0
+
         while self.running:
             try:
-                # Get update with timeout
-                action, file_path = self.update_queue.get(timeout=1)
-
-                if action == 'add' or action == 'modify':
-                    # Update index
-                    try:
-                        self.indexer.update_file(file_path)
-                        if self.update_callback:
-                            self.update_callback(action, str(file_path))
-                    except Exception as e:
-                        print(f"Error indexing {file_path}: {e}")
-
-                elif action == 'delete':
-                    # Remove from index
-                    try:
-                        self.indexer.remove_path(str(file_path))
-                        if self.update_callback:
-                            self.update_callback(action, str(file_path))
-                    except Exception as e:
-                        print(f"Error removing {file_path}: {e}")
-
-                self.update_queue.task_done()
-
-            except Empty:
-                continue
+                # Wait for the first update, then let the debounce window fill
+                if not self._event_ready.wait(timeout=1):
+                    continue
+
+                deadline = time.monotonic() + debounce
+                while len(self._events) < max_batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._event_ready.clear()
+                    self._event_ready.wait(remaining)
+
+                self._event_ready.clear()
+                events = []
+                while self._events and len(events) < max_batch:
+                    events.append(self._events.popleft())
+
+                # Leave the flag raised if a burst overflowed this batch
+                if self._events:
+                    self._event_ready.set()
+
+                self._flush_updates(self._coalesce(events))
+
             except Exception as e:
                 print(f"Error processing update: {e}")
 
+    @staticmethod
+    def _coalesce(events: List[tuple]) -> dict:
+        """Collapse a burst of events to one action per path.
+
+        Args:
+            events: List of (action, file_path) tuples in arrival order
+
+        Returns:
+            Ordered mapping of file_path -> action
+        """
+        pending: dict = {}
+        first: dict = {}  # file_path -> first action in the burst
+        for action, file_path in events:
+            first.setdefault(file_path, action)
+            previous = pending.get(file_path)
+            if previous == 'add' and action == 'modify':
+                continue
+            if previous == 'add' and action == 'delete' and first[file_path] == 'add':
+                # Created and removed within the burst; never indexed
+                del pending[file_path]
+                continue
+            pending[file_path] = action
+        return pending
+
+    def _flush_updates(self, pending: dict) -> None:
+        """Apply coalesced updates to the index in a single transaction.
+
+        Large batches are read by worker processes and written by this
+        thread through a single index writer.
+
+        Args:
+            pending: Mapping of file_path -> action
+        """
+        if not pending:
+            return
+
+        updated = [p for p, action in pending.items() if action != 'delete']
+        removed = [p for p, action in pending.items() if action == 'delete']
+
+        executor = None
+        if len(updated) >= self.POOL_MIN_BATCH:
+            if self._pool is None:
+                # The watchdog and Qt threads are live here; forking could
+                # copy a held lock into the child
+                self._pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            executor = self._pool
+
+        try:
+            indexed = self.indexer.update_files(updated, removed_paths=removed, executor=executor)
+        except Exception as e:
+            print(f"Error updating index: {e}")
+            return
+
+        if self.update_callback:
+            for file_path in indexed:
+                self.update_callback(pending[file_path], str(file_path))
+            for file_path in removed:
+                self.update_callback('delete', str(file_path))
+
     def get_stats(self) -> dict:
         """Get watcher statistics.
 
@@ -206,6 +487,6 @@ class FileWatcher:
         return {
             'running': self.running,
             'watch_paths': [str(p) for p in self.watch_paths],
-            'cached_files': len(self.file_cache),
-            'pending_updates': self.update_queue.qsize(),
+            'cached_files': sum(len(files) for files in self.file_cache.values()),
+            'pending_updates': len(self._events),
         }
@@ -1,27 +1,239 @@
 """File indexing engine using Whoosh."""
 import os
+import sys
+import threading
 import mimetypes
+import multiprocessing
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Callable
-from whoosh import index
+from functools import partial
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from whoosh import index, writing
 from whoosh.fields import Schema, TEXT, ID, DATETIME, NUMERIC
 from whoosh.qparser import MultifieldParser, FuzzyTermPlugin
 from whoosh.query import Query
 import hashlib
 
+try:
+    import blake3
+except ImportError:  # pragma: no cover - optional dependency
+    blake3 = None
+
+
+# Read size for checksumming; large reads keep the hash CPU-bound rather
+# than dominated by per-call overhead
+CHECKSUM_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# hashlib.file_digest is new in Python 3.11
+_file_digest = getattr(hashlib, 'file_digest', None)
+
+# Read-ahead hints are only available on Linux and some Unixes
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
+# Leading bytes checked for NUL when deciding whether "text" is really binary
+BINARY_SNIFF_SIZE = 8192
+
+# mimetypes.guess_type result per extension; guess_type walks its tables
+# on every call
+_filetype_cache: Dict[str, str] = {}
+
+
+def _extension(filename: str) -> str:
+    """Return a file name's extension, matching ``Path.suffix``.
+
+    Args:
+        filename: File name (no directory part)
+
+    Returns:
+        Extension including the leading dot, or an empty string
+    """
+    dot = filename.rfind('.')
+    return filename[dot:] if dot > 0 else ''
+
+
+def _guess_filetype(filename: str, extension: Optional[str] = None) -> str:
+    """Get the broad file type ('text', 'image', ...) for a file name.
+
+    Args:
+        filename: File name (no directory part)
+        extension: The name's extension, if the caller already has it
+
+    Returns:
+        Top-level MIME type, or 'unknown'
+    """
+    if extension is None:
+        extension = _extension(filename)
+    if extension in mimetypes.encodings_map:
+        # Compressed files (.tar.gz) are typed by their inner extension
+        mime_type, _ = mimetypes.guess_type(filename)
+        return mime_type.split('/')[0] if mime_type else 'unknown'
+
+    filetype = _filetype_cache.get(extension)
+    if filetype is None:
+        mime_type, _ = mimetypes.guess_type('file' + extension)
+        filetype = mime_type.split('/')[0] if mime_type else 'unknown'
+        _filetype_cache[extension] = filetype
+    return filetype
+
+
+def extract_document(
+    file_path: str,
+    stat: Optional[os.stat_result] = None,
+    checksum_binary: bool = True
+) -> Dict[str, Any]:
+    """Read a file's metadata and content into index fields.
+
+    Kept at module level so it can run in worker processes.
+
+    Args:
+        file_path: Path to file
+        stat: Stat result already gathered by the caller, if any
+        checksum_binary: Whether to hash files that aren't text; reading a
+            large binary file just for its checksum is often the bulk of
+            the I/O
+
+    Returns:
+        Field dictionary for Whoosh's update_document
+
+    Raises:
+        OSError: If the file cannot be accessed
+    """
+    directory, filename = os.path.split(file_path)
+    extension = _extension(filename)
+
+    # Determine file type ('text', 'image', 'audio', etc.); extension-based,
+    # so it needs no I/O
+    filetype = _guess_filetype(filename, extension)
+
+    # Get file metadata
+    if stat is None:
+        stat = os.stat(file_path)
+    size = stat.st_size
+
+    # Read content for text files
+    content = ""
+    checksum = None
+    if filetype == 'text' and size < 1024 * 1024:  # Only index text < 1MB
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            # Hash the bytes already in memory instead of reading them again
+            hasher = _new_hasher()
+            hasher.update(data)
+            checksum = hasher.hexdigest()
+            # The type comes from the extension alone; skip files that are
+            # actually binary rather than decoding them
+            if b'\x00' not in data[:BINARY_SNIFF_SIZE]:
+                content = data.decode('utf-8', errors='ignore')
+        except Exception:
+            pass
+
+    if checksum is None:
+        checksum = calculate_checksum(file_path) if checksum_binary or filetype == 'text' else ''
+
+    return {
+        'path': file_path,
+        'filename': filename,
+        'extension': extension.lower(),
+        'content': content,
+        'size': size,
+        'modified': datetime.fromtimestamp(stat.st_mtime),
+        'created': datetime.fromtimestamp(stat.st_ctime),
+        'filetype': filetype,
+        'directory': directory,
+        'checksum': checksum,
+    }
+
+
+def _extract_document_safely(
+    file_path: str,
+    stat: Optional[os.stat_result] = None,
+    checksum_binary: bool = True
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Run extract_document, returning errors instead of raising.
+
+    Lets executor.map keep going past files that vanish, can't be read or
+    fail to convert.
+
+    Args:
+        file_path: Path to file
+        stat: Stat result already gathered by the caller, if any
+        checksum_binary: Whether to hash files that aren't text
+
+    Returns:
+        Tuple of (fields, None) on success or (None, error message)
+    """
+    try:
+        return extract_document(file_path, stat, checksum_binary), None
+    except (OSError, PermissionError) as e:
+        return None, f"Cannot access file: {e}"
+    except Exception as e:
+        # e.g. an mtime datetime can't represent; one bad file mustn't
+        # abort the whole run
+        return None, str(e)
+
+
+def _new_hasher():
+    """Create the hash object used for file checksums.
+
+    Returns:
+        BLAKE3 hasher when the blake3 package is installed, otherwise SHA-256
+        (which uses the CPU's SHA extensions where available)
+    """
+    if blake3 is not None:
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.sha256()
+
+
+def calculate_checksum(file_path: str) -> str:
+    """Calculate the checksum of a file.
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        Hex digest (64 characters), or an empty string if the file cannot
+        be read
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            if _HAS_FADVISE:
+                # Let the kernel read ahead aggressively while we hash
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            if _file_digest is not None:
+                # Reads into one preallocated buffer instead of a new
+                # bytes object per chunk
+                return _file_digest(f, _new_hasher).hexdigest()
+
+            # Read in chunks to handle large files
+            hasher = _new_hasher()
+            for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b''):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+    except Exception:
+        return ""
+
 
 class FileIndexer:
     """Indexes files for fast searching."""
 
-    # Define search schema
+    # Directories with fewer files than this are indexed in-process
+    POOL_MIN_FILES = 64
+
+    # Threads scanning directories while collecting files; the walk waits
+    # on I/O, not the GIL
+    WALK_THREADS = min(32, (os.cpu_count() or 1) * 4)
+
+    # Define search schema. path, size and modified also get columns so
+    # the reindex check can read them without loading stored documents
     SCHEMA = Schema(
-        path=ID(stored=True, unique=True),
+        path=ID(stored=True, unique=True, sortable=True),
         filename=TEXT(stored=True),
         extension=TEXT(stored=True),
         content=TEXT(stored=True),
-        size=NUMERIC(stored=True),
-        modified=DATETIME(stored=True),
+        size=NUMERIC(stored=True, sortable=True),
+        modified=DATETIME(stored=True, sortable=True),
         created=DATETIME(stored=True),
         filetype=TEXT(stored=True),
         directory=TEXT(stored=True),
@@ -45,6 +257,9 @@ class FileIndexer:
         else:
             self.ix = index.create_in(str(self.index_path), self.SCHEMA)
 
+        # Bumped after every commit so result caches can tell they are stale
+        self.version = 0
+
         # Initialize mimetypes
         mimetypes.init()
 
@@ -62,66 +277,285 @@ class FileIndexer:
         Returns:
             Statistics dictionary
         """
-        directory = Path(directory)
-        if not directory.exists():
-            raise ValueError(f"Directory does not exist: {directory}")
-
-        excluded_dirs = set(self.config.get('index.excluded_dirs', []))
-        excluded_exts = set(self.config.get('index.excluded_extensions', []))
-        max_size_mb = self.config.get('index.max_file_size_mb', 100)
-        max_size_bytes = max_size_mb * 1024 * 1024
-
-        # Collect files to index
-        files_to_index = []
-        for root, dirs, files in os.walk(directory):
-            # Filter out excluded directories
-            dirs[:] = [d for d in dirs if d not in excluded_dirs]
+        return self.index_directories([directory], progress_callback)
 
-            for filename in files:
-                file_path = Path(root) / filename
-
-                # Skip excluded extensions
-                if file_path.suffix in excluded_exts:
-                    continue
+    def index_directories(
+        self,
+        directories: List[str],
+        progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        remove_missing: bool = False,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, int]:
+        """Index several directory trees in one pass.
 
-                # Skip hidden files if configured
-                if not self.config.get('ui.show_hidden_files', False):
-                    if filename.startswith('.'):
-                        continue
+        The trees are walked concurrently and written with a single writer;
+        Whoosh allows only one writer at a time, so indexing them one by one
+        from separate threads would just serialize on the index lock.
 
-                # Skip files that are too large
-                try:
-                    if file_path.stat().st_size > max_size_bytes:
-                        continue
-                except (OSError, PermissionError):
-                    continue
+        Args:
+            directories: Directories to index
+            progress_callback: Optional callback(current, total, filename)
+            remove_missing: Also drop indexed files under these directories
+                that the walk no longer finds, so an incremental reindex
+                matches a full one
+            cancel_event: Optional event that stops indexing when set; files
+                written so far are kept
 
-                files_to_index.append(file_path)
+        Returns:
+            Statistics dictionary
+        """
+        directories = [str(directory) for directory in directories]
+        for directory in directories:
+            if not os.path.exists(directory):
+                raise ValueError(f"Directory does not exist: {directory}")
+
+        # Collect files to index, keeping the stat from the directory scan
+        # so each file is stat'ed once
+        paths, stats_by_path = self._collect_files(directories, cancel_event)
+        if cancel_event is not None and cancel_event.is_set():
+            return {'indexed': 0, 'skipped': 0, 'errors': 0}
+
+        # Files whose size and mtime match the index are already up to date;
+        # skip them instead of reading and hashing them again
+        indexed_state = self._indexed_state()
+        stats = {'indexed': 0, 'skipped': 0, 'errors': 0}
+        changed_paths = []
+        changed_stats = []
+        seen = set()
+        for file_path, stat in zip(paths, stats_by_path):
+            # Nested or repeated roots list the same files more than once
+            if file_path in seen:
+                continue
+            seen.add(file_path)
+            state = indexed_state.get(file_path)
+            if state is not None and state == (stat.st_size, datetime.fromtimestamp(stat.st_mtime)):
+                stats['skipped'] += 1
+            else:
+                changed_paths.append(file_path)
+                changed_stats.append(stat)
+        paths, stats_by_path = changed_paths, changed_stats
+
+        stale_paths = []
+        if remove_missing:
+            roots = tuple(os.path.join(directory, '') for directory in directories)
+            stale_paths = [
+                path for path in indexed_state
+                if path not in seen and path.startswith(roots)
+            ]
 
         # Index files
-        stats = {'indexed': 0, 'skipped': 0, 'errors': 0}
-        total_files = len(files_to_index)
+        total_files = len(paths)
+
+        # Reading and hashing run in worker processes for large trees;
+        # documents are still written here since writers aren't shareable
+        executor = None
+        extract = partial(_extract_document_safely, checksum_binary=self._checksum_binary())
+        if total_files >= self.POOL_MIN_FILES:
+            # Forking a process with live walker/Qt threads can deadlock the child
+            executor = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context('spawn')
+            )
+            results = executor.map(extract, paths, stats_by_path, chunksize=32)
+        else:
+            results = map(extract, paths, stats_by_path)
 
-        writer = self.ix.writer()
+        writer = self._bulk_writer(total_files)
         try:
-            for i, file_path in enumerate(files_to_index):
-                if progress_callback:
-                    progress_callback(i + 1, total_files, str(file_path))
+            for i, (file_path, (fields, error)) in enumerate(zip(paths, results)):
+                if cancel_event is not None and cancel_event.is_set():
+                    stale_paths = []
+                    break
 
-                try:
-                    self._index_file(file_path, writer)
-                    stats['indexed'] += 1
-                except Exception as e:
+                if progress_callback:
+                    progress_callback(i + 1, total_files, file_path)
+
+                if error is None:
+                    try:
+                        if file_path in indexed_state:
+                            writer.update_document(**fields)
+                        else:
+                            # Not in the index yet; skip update_document's delete lookup
+                            writer.add_document(**fields)
+                        stats['indexed'] += 1
+                    except Exception as e:
+                        stats['errors'] += 1
+                        print(f"Error indexing {file_path}: {e}")
+                else:
                     stats['errors'] += 1
-                    print(f"Error indexing {file_path}: {e}")
+                    print(f"Error indexing {file_path}: {error}")
+
+            for path in stale_paths:
+                writer.delete_by_term('path', path)
 
             writer.commit()
+            self.version += 1
         except Exception as e:
             writer.cancel()
             raise e
+        finally:
+            if executor is not None:
+                if sys.version_info >= (3, 9):
+                    # Don't read the rest of the files after a cancel
+                    executor.shutdown(cancel_futures=True)
+                else:
+                    executor.shutdown()
 
         return stats
 
+    def _collect_files(
+        self,
+        directories: List[str],
+        cancel_event: Optional[threading.Event] = None
+    ) -> Tuple[List[str], List[os.stat_result]]:
+        """Find the files to index below some directories.
+
+        Directories are scanned by a pool of threads sharing a LIFO stack,
+        so a slow readdir (network shares, cold disks) doesn't stall the
+        whole walk, and separate roots are walked side by side.
+
+        Args:
+            directories: Directories to walk
+            cancel_event: Optional event that stops the walk when set; the
+                files found so far are returned
+
+        Returns:
+            Tuple of (paths, stat results) in matching order
+        """
+        excluded_dirs = frozenset(self.config.get('index.excluded_dirs', []))
+        excluded_exts = frozenset(self.config.get('index.excluded_extensions', []))
+        max_size_mb = self.config.get('index.max_file_size_mb', 100)
+        max_size_bytes = max_size_mb * 1024 * 1024
+        show_hidden = self.config.get('ui.show_hidden_files', False)
+
+        paths = []
+        stats_by_path = []
+        pending = list(directories)
+        active = 0  # Directories currently being scanned
+        cond = threading.Condition()
+
+        def scan(dir_path: str):
+            subdirs = []
+            found = []
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        filename = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            # Filter out excluded directories
+                            if filename not in excluded_dirs:
+                                subdirs.append(entry.path)
+                            continue
+
+                        if not entry.is_file():
+                            continue
+
+                        # Skip excluded extensions
+                        if _extension(filename) in excluded_exts:
+                            continue
+
+                        # Skip hidden files if configured
+                        if not show_hidden and filename.startswith('.'):
+                            continue
+
+                        # Skip files that are too large
+                        try:
+                            stat = entry.stat()
+                        except (OSError, PermissionError):
+                            continue
+                        if stat.st_size > max_size_bytes:
+                            continue
+
+                        found.append((entry.path, stat))
+            except (OSError, PermissionError):
+                pass
+            return subdirs, found
+
+        def worker():
+            nonlocal active
+            while True:
+                with cond:
+                    while not pending and active:
+                        cond.wait()
+                    if not pending:
+                        return  # Nothing queued and nobody left to queue more
+                    if cancel_event is not None and cancel_event.is_set():
+                        return
+                    dir_path = pending.pop()
+                    active += 1
+
+                subdirs, found = scan(dir_path)
+
+                with cond:
+                    pending.extend(subdirs)
+                    for file_path, stat in found:
+                        paths.append(file_path)
+                        stats_by_path.append(stat)
+                    active -= 1
+                    cond.notify_all()
+
+        workers = [
+            threading.Thread(target=worker, daemon=True)
+            for _ in range(self.WALK_THREADS)
+        ]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        return paths, stats_by_path
+
+    def _checksum_binary(self) -> bool:
+        """Whether non-text files get a checksum.
+
+        Returns:
+            Value of the index.checksum_binary option
+        """
+        return self.config.get('index.checksum_binary', False)
+
+    def _bulk_writer(self, file_count: int):
+        """Open a writer tuned for indexing many files at once.
+
+        Args:
+            file_count: Number of files about to be written
+
+        Returns:
+            Whoosh writer instance
+        """
+        # limitmb applies to each writer process
+        limitmb = self.config.get('index.writer.limitmb', 256)
+        if file_count < self.POOL_MIN_FILES:
+            return self.ix.writer(limitmb=limitmb)
+
+        procs = self.config.get('index.writer.procs', 4) or os.cpu_count()
+        return self.ix.writer(limitmb=limitmb, procs=procs, multisegment=True)
+
+    def _indexed_state(self) -> Dict[str, Tuple[int, datetime]]:
+        """Get the stored size and modification time of every indexed file.
+
+        Returns:
+            Mapping of path -> (size, modified)
+        """
+        if self.ix.is_empty():
+            return {}
+
+        with self.ix.searcher() as searcher:
+            reader = searcher.reader()
+            state_fields = ('path', 'size', 'modified')
+            if all(reader.has_column(name) for name in state_fields):
+                paths, sizes, modified = (reader.column_reader(name) for name in state_fields)
+                return {
+                    paths[doc]: (sizes[doc], modified[doc])
+                    for doc in reader.all_doc_ids()
+                }
+
+            # Indexes created before the columns existed; stored fields are
+            # unpickled whole, content included, so this is much slower
+            return {
+                fields['path']: (fields.get('size'), fields.get('modified'))
+                for _, fields in reader.iter_docs()
+            }
+
     def _index_file(self, file_path: Path, writer) -> None:
         """Index a single file.
 
@@ -130,70 +564,23 @@ class FileIndexer:
             writer: Whoosh writer instance
         """
         try:
-            stat = file_path.stat()
-
-            # Get file metadata
-            filename = file_path.name
-            extension = file_path.suffix.lower()
-            size = stat.st_size
-            modified = datetime.fromtimestamp(stat.st_mtime)
-            created = datetime.fromtimestamp(stat.st_ctime)
-            directory = str(file_path.parent)
-
-            # Determine file type
-            mime_type, _ = mimetypes.guess_type(str(file_path))
-            if mime_type:
-                filetype = mime_type.split('/')[0]  # 'text', 'image', 'audio', etc.
-            else:
-                filetype = 'unknown'
-
-            # Read content for text files
-            content = ""
-            if filetype == 'text' and size < 1024 * 1024:  # Only index text < 1MB
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                except Exception:
-                    pass
-
-            # Calculate checksum
-            checksum = self._calculate_checksum(file_path)
-
-            # Add to index
-            writer.update_document(
-                path=str(file_path),
-                filename=filename,
-                extension=extension,
-                content=content,
-                size=size,
-                modified=modified,
-                created=created,
-                filetype=filetype,
-                directory=directory,
-                checksum=checksum,
-            )
-
+            fields = extract_document(str(file_path), checksum_binary=self._checksum_binary())
         except (OSError, PermissionError) as e:
             raise Exception(f"Cannot access file: {e}")
 
+        # Add to index
+        writer.update_document(**fields)
+
     def _calculate_checksum(self, file_path: Path) -> str:
-        """Calculate MD5 checksum of file.
+        """Calculate checksum of file.
 
         Args:
             file_path: Path to file
 
         Returns:
-            MD5 checksum
+            Hex digest
         """
-        try:
-            md5 = hashlib.md5()
-            with open(file_path, 'rb') as f:
-                # Read in chunks to handle large files
-                for chunk in iter(lambda: f.read(4096), b''):
-                    md5.update(chunk)
-            return md5.hexdigest()
-        except Exception:
-            return ""
+        return calculate_checksum(str(file_path))
 
     def remove_path(self, path: str) -> int:
         """Remove a path from the index.
@@ -207,6 +594,7 @@ class FileIndexer:
         writer = self.ix.writer()
         count = writer.delete_by_term('path', path)
         writer.commit()
+        self.version += 1
         return count
 
     def update_file(self, file_path: Path) -> None:
@@ -219,14 +607,66 @@ class FileIndexer:
         try:
             self._index_file(file_path, writer)
             writer.commit()
+            self.version += 1
+        except Exception as e:
+            writer.cancel()
+            raise e
+
+    def update_files(
+        self,
+        file_paths: List[Path],
+        removed_paths: List[Path] = (),
+        executor: Optional[Executor] = None
+    ) -> List[Path]:
+        """Update and remove many files in a single index transaction.
+
+        Args:
+            file_paths: Paths to (re)index
+            removed_paths: Paths to remove from the index
+            executor: Optional executor (e.g. a ProcessPoolExecutor) used to
+                read files in parallel; documents are still written here
+
+        Returns:
+            List of paths that were indexed successfully
+        """
+        if executor is not None:
+            checksum_binary = self._checksum_binary()
+            futures = [
+                executor.submit(extract_document, str(p), None, checksum_binary)
+                for p in file_paths
+            ]
+        else:
+            futures = None
+
+        indexed = []
+        writer = self.ix.writer()
+        try:
+            for file_path in removed_paths:
+                writer.delete_by_term('path', str(file_path))
+
+            for i, file_path in enumerate(file_paths):
+                try:
+                    if futures is None:
+                        self._index_file(file_path, writer)
+                    else:
+                        writer.update_document(**futures[i].result())
+                    indexed.append(file_path)
+                except Exception as e:
+                    print(f"Error indexing {file_path}: {e}")
+
+            writer.commit()
+            self.version += 1
         except Exception as e:
             writer.cancel()
             raise e
 
+        return indexed
+
     def clear_index(self) -> None:
         """Clear all documents from the index."""
         writer = self.ix.writer()
-        writer.commit(mergetype=index.CLEAR)
+        writer.commit(mergetype=writing.CLEAR)
+        self.version += 1
 
     def get_index_stats(self) -> Dict[str, Any]:
         """Get index statistics.
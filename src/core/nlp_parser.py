@@ -1,8 +1,13 @@
 """NLP-powered query parser for natural language search."""
 import re
+from functools import cached_property, lru_cache
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
-import spacy
+
+
+# Only queries with a run of capitalised words ("Annual Report") are worth
+# sending through named-entity recognition
+_ENTITY_HINT = re.compile(r'\b[A-Z][a-z]+ [A-Z]')
 
 
 class NLPQueryParser:
@@ -10,9 +15,6 @@ class NLPQueryParser:
 
     def __init__(self):
         """Initialize NLP parser."""
-        self.nlp = None
-        self._load_model()
-
         # File type mappings
         self.filetype_keywords = {
             'document': ['doc', 'docx', 'pdf', 'txt', 'document', 'documents'],
@@ -40,16 +42,103 @@ class NLPQueryParser:
             'year': 365,
         }
 
+        self._compile_patterns()
+
+        # Search-as-you-type re-parses the same prefixes over and over
+        self._parse_cached = lru_cache(maxsize=1024)(self._parse_query)
+
+    def _compile_patterns(self):
+        """Precompile the extraction regexes from the keyword tables.
+
+        Each keyword table gets one alternation that finds every keyword in
+        a single scan, plus an inverted keyword -> rank dict so the entry
+        listed first still wins when several are present. The per-keyword
+        patterns are only used to strip the winner from the query.
+        """
+        self._keyword_to_filetype = {}
+        self._filetype_patterns = {}
+        for filetype, keywords in self.filetype_keywords.items():
+            for keyword in keywords:
+                if keyword not in self._keyword_to_filetype:
+                    self._keyword_to_filetype[keyword] = (len(self._keyword_to_filetype), filetype)
+                self._filetype_patterns[keyword] = re.compile(
+                    r'\b(type:|filetype:)?' + re.escape(keyword) + r'\b', re.IGNORECASE
+                )
+        self._filetype_re = re.compile(
+            r'\b(?:type:|filetype:)?(' + '|'.join(map(re.escape, self._keyword_to_filetype)) + r')\b'
+        )
+
+        # Pattern: ext:py, .py, extension:pdf, etc.
+        self._extension_patterns = [
+            re.compile(r'\b(ext|extension):\s*\.?(\w+)\b', re.IGNORECASE),
+            re.compile(r'\b\.(\w{2,5})\b(?=\s|$)', re.IGNORECASE),  # Standalone .ext
+        ]
+
+        size_names = '|'.join(map(re.escape, self.size_keywords))
+        self._size_ranks = {name: rank for rank, name in enumerate(self.size_keywords)}
+        self._size_re = re.compile(r'\b(' + size_names + r')\s+(?:file|files)?\b')
+        self._size_patterns = {
+            name: re.compile(r'\b' + name + r'\s+(file|files)?\b', re.IGNORECASE)
+            for name in self.size_keywords
+        }
+        # Explicit size (e.g., "size > 5MB", "larger than 1GB")
+        self._explicit_size_pattern = re.compile(
+            r'\b(size|larger than|smaller than|>|<)\s*(\d+)\s*(mb|gb|kb|bytes?)?\b', re.IGNORECASE
+        )
+
+        # Keys are (prefixed, name); "modified today" outranks a bare "today"
+        time_names = '|'.join(map(re.escape, self.time_keywords))
+        self._time_ranks = {}
+        self._time_patterns = {}
+        for rank, time_name in enumerate(self.time_keywords):
+            self._time_ranks[(True, time_name)] = 2 * rank
+            self._time_ranks[(False, time_name)] = 2 * rank + 1
+            self._time_patterns[(True, time_name)] = re.compile(
+                r'\b(from|modified|created|within)\s+' + time_name + r'\b', re.IGNORECASE
+            )
+            self._time_patterns[(False, time_name)] = re.compile(
+                r'\b' + time_name + r"'?s?\b", re.IGNORECASE
+            )
+        self._time_re = re.compile(
+            r'\b(?:(?:from|modified|created|within)\s+(' + time_names + r')\b'
+            r"|(" + time_names + r")'?s?\b)"
+        )
+
+        # Pattern: in:/path/to/dir, directory:/path, path:/path
+        self._directory_patterns = [
+            re.compile(r'\b(in|directory|path|folder):\s*([^\s]+)\b', re.IGNORECASE),
+            re.compile(r'\bin\s+([/\\][\w/\\]+)\b', re.IGNORECASE),
+        ]
+
+    @cached_property
+    def nlp(self):
+        """spaCy pipeline, loaded on first use.
+
+        Returns:
+            spaCy Language with an 'ner' pipe, or None if unavailable
+        """
+        return self._load_model()
+
     def _load_model(self):
-        """Load spaCy model (with fallback)."""
+        """Load spaCy model (with fallback).
+
+        Returns:
+            Loaded model, or None if spaCy or the model is not installed
+        """
+        try:
+            import spacy
+        except ImportError:
+            print("Warning: spaCy not installed. Using basic parsing.")
+            return None
+
         try:
             # Try to load English model
-            self.nlp = spacy.load('en_core_web_sm')
+            return spacy.load('en_core_web_sm')
         except OSError:
-            # Model not installed, create blank model
+            # Model not installed; a blank model finds no entities, so skip it
             print("Warning: spaCy model 'en_core_web_sm' not found. Using basic parsing.")
             print("Install with: python -m spacy download en_core_web_sm")
-            self.nlp = spacy.blank('en')
+            return None
 
     def parse(self, query: str) -> Dict[str, Any]:
         """Parse natural language query into structured parameters.
@@ -64,6 +153,29 @@ class NLPQueryParser:
         if not query:
             return {'query': '', 'filters': {}, 'metadata': {}}
 
+        cleaned_query, filters, metadata, days_ago = self._parse_cached(query)
+
+        # Copy so callers can't modify cached results
+        filters = dict(filters)
+        if days_ago is not None:
+            # Relative to the current time, so never cached
+            filters['modified_after'] = datetime.now() - timedelta(days=days_ago)
+
+        return {
+            'query': cleaned_query,
+            'filters': filters,
+            'metadata': dict(metadata),
+        }
+
+    def _parse_query(self, query: str) -> Tuple[str, Dict[str, Any], Dict[str, Any], Optional[int]]:
+        """Extract filters from a stripped, non-empty query.
+
+        Args:
+            query: Natural language query
+
+        Returns:
+            Tuple of (cleaned_query, filters, metadata, days_ago)
+        """
         # Extract filters and clean query
         filters = {}
         metadata = {}
@@ -88,9 +200,8 @@ class NLPQueryParser:
             metadata['size_detected'] = True
 
         # Extract time constraints
-        time_filter, cleaned_query = self._extract_time(cleaned_query)
-        if time_filter:
-            filters.update(time_filter)
+        days_ago, cleaned_query = self._extract_time(cleaned_query)
+        if days_ago is not None:
             metadata['time_detected'] = True
 
         # Extract directory/path hints
@@ -100,18 +211,31 @@ class NLPQueryParser:
             metadata['directory_detected'] = True
 
         # Use spaCy for entity recognition if available
-        if self.nlp and hasattr(self.nlp, 'pipe_names'):
+        if _ENTITY_HINT.search(cleaned_query) and self.nlp is not None and self.nlp.has_pipe('ner'):
             doc = self.nlp(cleaned_query)
             # Extract named entities that might be filenames or topics
             entities = [ent.text for ent in doc.ents]
             if entities:
                 metadata['entities'] = entities
 
-        return {
-            'query': cleaned_query.strip(),
-            'filters': filters,
-            'metadata': metadata,
-        }
+        return cleaned_query.strip(), filters, metadata, days_ago
+
+    @staticmethod
+    def _first_by_rank(keys, ranks: Dict[Any, Any]) -> Optional[Any]:
+        """Pick the key that ranks first among those found in a query.
+
+        Args:
+            keys: Keys of the matches found by a scan
+            ranks: Mapping of key -> sortable rank
+
+        Returns:
+            Best-ranked key, or None if there were no matches
+        """
+        best = None
+        for key in keys:
+            if best is None or ranks[key] < ranks[best]:
+                best = key
+        return best
 
     def _extract_filetype(self, query: str) -> Tuple[Optional[str], str]:
         """Extract file type from query.
@@ -122,19 +246,16 @@ class NLPQueryParser:
         Returns:
             Tuple of (filetype, cleaned_query)
         """
-        query_lower = query.lower()
-
-        for filetype, keywords in self.filetype_keywords.items():
-            for keyword in keywords:
-                # Look for standalone keyword or "type:keyword"
-                pattern = r'\b(type:|filetype:)?' + re.escape(keyword) + r'\b'
-                match = re.search(pattern, query_lower)
-                if match:
-                    # Remove from query
-                    cleaned = re.sub(pattern, '', query, flags=re.IGNORECASE)
-                    return filetype, cleaned
+        keyword = self._first_by_rank(
+            (match.group(1) for match in self._filetype_re.finditer(query.lower())),
+            self._keyword_to_filetype
+        )
+        if keyword is None:
+            return None, query
 
-        return None, query
+        # Remove from query
+        cleaned = self._filetype_patterns[keyword].sub('', query)
+        return self._keyword_to_filetype[keyword][1], cleaned
 
     def _extract_extension(self, query: str) -> Tuple[Optional[str], str]:
         """Extract file extension from query.
@@ -145,17 +266,11 @@ class NLPQueryParser:
         Returns:
             Tuple of (extension, cleaned_query)
         """
-        # Pattern: ext:py, .py, extension:pdf, etc.
-        patterns = [
-            r'\b(ext|extension):\s*\.?(\w+)\b',
-            r'\b\.(\w{2,5})\b(?=\s|$)',  # Standalone .ext
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
+        for pattern in self._extension_patterns:
+            match = pattern.search(query)
             if match:
                 ext = match.group(2) if match.lastindex >= 2 else match.group(1)
-                cleaned = re.sub(pattern, '', query, flags=re.IGNORECASE)
+                cleaned = pattern.sub('', query)
                 return ext, cleaned
 
         return None, query
@@ -172,21 +287,23 @@ class NLPQueryParser:
         query_lower = query.lower()
 
         # Check for size keywords
-        for size_name, (min_size, max_size) in self.size_keywords.items():
-            pattern = r'\b' + size_name + r'\s+(file|files)?\b'
-            if re.search(pattern, query_lower):
-                size_filter = {}
-                if min_size is not None:
-                    size_filter['size_min'] = min_size
-                if max_size is not None:
-                    size_filter['size_max'] = max_size
-
-                cleaned = re.sub(pattern, '', query, flags=re.IGNORECASE)
-                return size_filter, cleaned
+        size_name = self._first_by_rank(
+            (match.group(1) for match in self._size_re.finditer(query_lower)),
+            self._size_ranks
+        )
+        if size_name is not None:
+            min_size, max_size = self.size_keywords[size_name]
+            size_filter = {}
+            if min_size is not None:
+                size_filter['size_min'] = min_size
+            if max_size is not None:
+                size_filter['size_max'] = max_size
+
+            cleaned = self._size_patterns[size_name].sub('', query)
+            return size_filter, cleaned
 
         # Check for explicit size (e.g., "size > 5MB", "larger than 1GB")
-        size_pattern = r'\b(size|larger than|smaller than|>|<)\s*(\d+)\s*(mb|gb|kb|bytes?)?\b'
-        match = re.search(size_pattern, query_lower)
+        match = self._explicit_size_pattern.search(query_lower)
         if match:
             operator = match.group(1)
             value = int(match.group(2))
@@ -202,37 +319,33 @@ class NLPQueryParser:
             elif operator in ['<', 'smaller than', 'size <']:
                 size_filter['size_max'] = size_bytes
 
-            cleaned = re.sub(size_pattern, '', query, flags=re.IGNORECASE)
+            cleaned = self._explicit_size_pattern.sub('', query)
             return size_filter, cleaned
 
         return None, query
 
-    def _extract_time(self, query: str) -> Tuple[Optional[Dict[str, datetime]], str]:
+    def _extract_time(self, query: str) -> Tuple[Optional[int], str]:
         """Extract time constraints from query.
 
         Args:
             query: Search query
 
         Returns:
-            Tuple of (time_filter_dict, cleaned_query)
+            Tuple of (days_ago, cleaned_query)
         """
         query_lower = query.lower()
-        now = datetime.now()
 
         # Check for time keywords
-        for time_name, days_ago in self.time_keywords.items():
-            patterns = [
-                r'\b(from|modified|created|within)\s+' + time_name + r'\b',
-                r'\b' + time_name + r"'?s?\b",
-            ]
-
-            for pattern in patterns:
-                if re.search(pattern, query_lower):
-                    since_date = now - timedelta(days=days_ago)
-                    time_filter = {'modified_after': since_date}
-
-                    cleaned = re.sub(pattern, '', query, flags=re.IGNORECASE)
-                    return time_filter, cleaned
+        key = self._first_by_rank(
+            (
+                (True, match.group(1)) if match.group(1) else (False, match.group(2))
+                for match in self._time_re.finditer(query_lower)
+            ),
+            self._time_ranks
+        )
+        if key is not None:
+            cleaned = self._time_patterns[key].sub('', query)
+            return self.time_keywords[key[1]], cleaned
 
         return None, query
 
@@ -245,17 +358,11 @@ class NLPQueryParser:
         Returns:
             Tuple of (directory, cleaned_query)
         """
-        # Pattern: in:/path/to/dir, directory:/path, path:/path
-        patterns = [
-            r'\b(in|directory|path|folder):\s*([^\s]+)\b',
-            r'\bin\s+([/\\][\w/\\]+)\b',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
+        for pattern in self._directory_patterns:
+            match = pattern.search(query)
             if match:
                 directory = match.group(2) if match.lastindex >= 2 else match.group(1)
-                cleaned = re.sub(pattern, '', query, flags=re.IGNORECASE)
+                cleaned = pattern.sub('', query)
                 return directory, cleaned
 
         return None, query
@@ -1,4 +1,9 @@
 """Search engine for querying indexed files."""
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from whoosh.qparser import MultifieldParser, QueryParser, FuzzyTermPlugin
 from whoosh.query import Query, Term, And, Or, Not
@@ -55,6 +60,14 @@ class SearchResult:
 class SearchEngine:
     """Advanced search engine with NLP capabilities."""
 
+    # Recent search results, reused while the index is unchanged
+    RESULT_CACHE_SIZE = 256
+    RESULT_CACHE_TTL = 30  # seconds
+
+    # Filters _build_query_uncached turns into query clauses; only these
+    # belong in its cache key
+    QUERY_FILTER_KEYS = ('extension', 'filetype', 'directory', 'size_min', 'size_max')
+
     def __init__(self, indexer, config_manager):
         """Initialize search engine.
 
@@ -77,11 +90,53 @@ class SearchEngine:
         if self.config.get('search.enable_fuzzy', True):
             self.parser.add_plugin(FuzzyTermPlugin())
 
+        # Single-field parsers; building one sets up its whole plugin chain
+        self._dir_parser = QueryParser('directory', self.ix.schema)
+        self._filename_parser = QueryParser('filename', self.ix.schema)
+        self._content_parser = QueryParser('content', self.ix.schema)
+
+        # Parsing is costly and search-as-you-type repeats queries; the
+        # cache key includes the fuzzy settings _preprocess_query reads
+        self._build_query_cached = lru_cache(maxsize=256)(self._build_query_uncached)
+
+        # key -> (expiry time, results); the index version in the key drops
+        # entries as soon as anything is committed
+        self._result_cache: OrderedDict = OrderedDict()
+        self._result_lock = threading.Lock()
+
+        # One searcher kept open across queries and refreshed when the
+        # index changes; searchers aren't safe to share between threads
+        self._searcher = None
+        self._searcher_lock = threading.Lock()
+
+    def _refreshed_searcher(self):
+        """Get the shared searcher, reopening it only if the index changed.
+
+        Must be called with _searcher_lock held.
+
+        Returns:
+            Whoosh Searcher instance
+        """
+        if self._searcher is None:
+            self._searcher = self.ix.searcher(weighting=scoring.BM25F())
+        else:
+            # Returns the same searcher when nothing was committed
+            self._searcher = self._searcher.refresh()
+        return self._searcher
+
+    def close(self) -> None:
+        """Close the shared searcher."""
+        with self._searcher_lock:
+            if self._searcher is not None:
+                self._searcher.close()
+                self._searcher = None
+
     def search(
         self,
         query_string: str,
         max_results: Optional[int] = None,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        highlight_top_k: int = 10
     ) -> List[SearchResult]:
         """Search for files.
 
@@ -89,6 +144,9 @@ class SearchEngine:
             query_string: Search query
             max_results: Maximum number of results
             filters: Optional filters (extension, filetype, etc.)
+            highlight_top_k: Number of top hits to compute highlights for;
+                highlighting re-tokenizes the stored text, so the rest
+                get none
 
         Returns:
             List of search results
@@ -99,12 +157,32 @@ class SearchEngine:
         if max_results is None:
             max_results = self.config.get('search.max_results', 100)
 
+        try:
+            cache_key = (
+                self.indexer.version,
+                query_string,
+                max_results,
+                highlight_top_k,
+                self._result_filter_key(filters),
+            )
+            hash(cache_key)
+        except TypeError:
+            cache_key = None  # Unhashable filter values
+
+        if cache_key is not None:
+            with self._result_lock:
+                cached = self._result_cache.get(cache_key)
+                if cached is not None and cached[0] > time.monotonic():
+                    self._result_cache.move_to_end(cache_key)
+                    return list(cached[1])
+
         # Parse query
         query = self._build_query(query_string, filters)
 
         # Execute search
         results = []
-        with self.ix.searcher(weighting=scoring.BM25F()) as searcher:
+        with self._searcher_lock:
+            searcher = self._refreshed_searcher()
             search_results = searcher.search(
                 query,
                 limit=max_results,
@@ -115,18 +193,19 @@ class SearchEngine:
             search_results.fragmenter.maxchars = self.config.get('search.snippet_size', 200)
             search_results.fragmenter.surround = 50
 
-            for hit in search_results:
+            for rank, hit in enumerate(search_results):
                 # Get highlights
                 highlights = {}
-                if 'content' in hit:
-                    content_highlight = hit.highlights('content')
-                    if content_highlight:
-                        highlights['content'] = content_highlight
+                if rank < highlight_top_k:
+                    if 'content' in hit:
+                        content_highlight = hit.highlights('content')
+                        if content_highlight:
+                            highlights['content'] = content_highlight
 
-                if 'filename' in hit:
-                    filename_highlight = hit.highlights('filename')
-                    if filename_highlight:
-                        highlights['filename'] = filename_highlight
+                    if 'filename' in hit:
+                        filename_highlight = hit.highlights('filename')
+                        if filename_highlight:
+                            highlights['filename'] = filename_highlight
 
                 # Create result
                 result = SearchResult(
@@ -136,7 +215,32 @@ class SearchEngine:
                 )
                 results.append(result)
 
-        return results
+        if cache_key is not None:
+            with self._result_lock:
+                self._result_cache[cache_key] = (time.monotonic() + self.RESULT_CACHE_TTL, results)
+                self._result_cache.move_to_end(cache_key)
+                while len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+
+        return list(results)
+
+    @staticmethod
+    def _result_filter_key(filters: Optional[Dict[str, Any]]) -> tuple:
+        """Build the result cache key part for the filters.
+
+        Relative dates from the NLP parser ("last week") are computed from
+        datetime.now(), so they differ on every call; they're keyed by day.
+
+        Args:
+            filters: Optional filters
+
+        Returns:
+            Sorted tuple of (key, value) pairs
+        """
+        return tuple(
+            (key, value.date() if isinstance(value, datetime) else value)
+            for key, value in sorted((filters or {}).items())
+        )
 
     def _build_query(self, query_string: str, filters: Optional[Dict[str, Any]] = None) -> Query:
         """Build Whoosh query from string and filters.
@@ -148,6 +252,33 @@ class SearchEngine:
         Returns:
             Whoosh Query object
         """
+        fuzzy = (
+            self.config.get('search.enable_fuzzy', True),
+            self.config.get('search.fuzzy_distance', 2),
+        )
+        filter_items = tuple(
+            (key, value) for key, value in sorted((filters or {}).items())
+            if key in self.QUERY_FILTER_KEYS
+        )
+        try:
+            return self._build_query_cached(query_string, filter_items, fuzzy)
+        except TypeError:
+            # Unhashable filter values; build without caching
+            return self._build_query_uncached(query_string, filter_items, fuzzy)
+
+    def _build_query_uncached(self, query_string: str, filter_items: tuple, fuzzy: tuple) -> Query:
+        """Build Whoosh query from string and filters.
+
+        Args:
+            query_string: Search query string
+            filter_items: (key, value) pairs of the filters in QUERY_FILTER_KEYS
+            fuzzy: (enable_fuzzy, fuzzy_distance) in effect, for the cache key
+
+        Returns:
+            Whoosh Query object
+        """
+        filters = dict(filter_items)
+
         # Process query string for special syntax
         processed_query = self._preprocess_query(query_string)
 
@@ -168,7 +299,7 @@ class SearchEngine:
                 filter_queries.append(Term('filetype', filters['filetype'].lower()))
 
             if 'directory' in filters and filters['directory']:
-                dir_query = QueryParser('directory', self.ix.schema).parse(filters['directory'])
+                dir_query = self._dir_parser.parse(filters['directory'])
                 filter_queries.append(dir_query)
 
             if 'size_min' in filters and filters['size_min'] is not None:
@@ -229,11 +360,11 @@ class SearchEngine:
         if max_results is None:
             max_results = self.config.get('search.max_results', 100)
 
-        parser = QueryParser('filename', self.ix.schema)
-        query = parser.parse(filename_pattern)
+        query = self._filename_parser.parse(filename_pattern)
 
         results = []
-        with self.ix.searcher() as searcher:
+        with self._searcher_lock:
+            searcher = self._refreshed_searcher()
             search_results = searcher.search(query, limit=max_results)
 
             for hit in search_results:
@@ -258,11 +389,11 @@ class SearchEngine:
         if max_results is None:
             max_results = self.config.get('search.max_results', 100)
 
-        parser = QueryParser('content', self.ix.schema)
-        query = parser.parse(content_query)
+        query = self._content_parser.parse(content_query)
 
         results = []
-        with self.ix.searcher() as searcher:
+        with self._searcher_lock:
+            searcher = self._refreshed_searcher()
             search_results = searcher.search(query, limit=max_results, terms=True)
             search_results.fragmenter.maxchars = self.config.get('search.snippet_size', 200)
 
@@ -290,7 +421,8 @@ class SearchEngine:
         Returns:
             SearchResult or None
         """
-        with self.ix.searcher() as searcher:
+        with self._searcher_lock:
+            searcher = self._refreshed_searcher()
             results = searcher.documents(path=file_path)
             for doc in results:
                 return SearchResult(document=dict(doc), score=1.0)
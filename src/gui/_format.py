@@ -0,0 +1,20 @@
+"""Display formatting shared by the GUI widgets."""
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+def format_size(size_bytes: int) -> str:
+    """Format file size for display.
+
+    Args:
+        size_bytes: Size in bytes
+
+    Returns:
+        Formatted size string, e.g. "1.5 MB"
+    """
+    size_bytes = int(size_bytes)
+    if size_bytes <= 0:
+        return "0.0 B"
+    # Each unit is 2**10 times the previous, so bit_length picks it directly
+    i = min((size_bytes.bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{size_bytes / (1 << (i * 10)):.1f} {_UNITS[i]}"
@@ -1,85 +1,137 @@
 """Indexing progress dialog."""
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QProgressBar, QTextEdit, QListWidget,
-    QFileDialog, QMessageBox
+    QPushButton, QProgressBar, QPlainTextEdit, QListWidget,
+    QFileDialog, QMessageBox, QCheckBox
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from pathlib import Path
+from collections import deque
+import os
+import threading
+
+_ELLIPSIS = "..."
 
 
 class IndexingThread(QThread):
     """Thread for indexing files."""
 
+    # How often the latest progress is sent to the GUI
+    PROGRESS_INTERVAL_MS = 50
+
     # Signals
     progress_updated = pyqtSignal(int, int, str)  # current, total, filename
-    finished_indexing = pyqtSignal(dict)  # statistics
+    finished_indexing = pyqtSignal(int, int, int)  # indexed, skipped, errors
     error_occurred = pyqtSignal(str)  # error message
 
-    def __init__(self, indexer, directories, reindex=False):
+    def __init__(self, indexer, directories, reindex=False, force_full=False):
         """Initialize indexing thread.
 
         Args:
             indexer: FileIndexer instance
             directories: List of directories to index
-            reindex: Whether to clear index first
+            reindex: Whether to bring the index fully in line with the
+                directories, dropping entries for deleted files
+            force_full: Clear the index first instead of only reindexing
+                files that changed
         """
         super().__init__()
         self.indexer = indexer
         self.directories = directories
         self.reindex = reindex
-        self.cancelled = False
+        self.force_full = force_full
+        self.cancel_event = threading.Event()
+
+        # The indexer only records its position; a timer on the GUI thread
+        # (this object lives there) forwards it, so the per-file cost is a
+        # single assignment rather than a cross-thread signal
+        self._progress = None
+        self._emitted_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(self.PROGRESS_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._emit_progress)
+        self.started.connect(self._progress_timer.start)
+        # Connected first so no stale update lands after the final one
+        self.finished_indexing.connect(self._progress_timer.stop)
+        self.finished.connect(self._progress_timer.stop)
 
     def run(self):
         """Run indexing process."""
+        total_stats = {'indexed': 0, 'skipped': 0, 'errors': 0}
         try:
-            # Clear index if reindexing
-            if self.reindex:
+            # Clear index only for a forced full reindex; otherwise files
+            # whose size and mtime are unchanged are skipped
+            if self.reindex and self.force_full:
                 self.indexer.clear_index()
 
-            total_stats = {'indexed': 0, 'skipped': 0, 'errors': 0}
-
-            # Index each directory
+            directories = []
             for directory in self.directories:
-                if self.cancelled:
-                    break
+                if Path(directory).exists():
+                    directories.append(directory)
+                else:
+                    self.error_occurred.emit(
+                        f"Error indexing {directory}: Directory does not exist: {directory}"
+                    )
 
+            # Index all directories together; they are walked in parallel
+            # and share one index writer
+            if directories and not self.cancel_event.is_set():
                 try:
-                    stats = self.indexer.index_directory(
-                        directory,
-                        progress_callback=self._progress_callback
+                    stats = self.indexer.index_directories(
+                        directories,
+                        progress_callback=self._progress_callback,
+                        remove_missing=self.reindex,
+                        cancel_event=self.cancel_event
                     )
 
                     # Accumulate stats
-                    for key in total_stats:
-                        total_stats[key] += stats.get(key, 0)
+                    ts = total_stats
+                    ts['indexed'] += stats.get('indexed', 0)
+                    ts['skipped'] += stats.get('skipped', 0)
+                    ts['errors'] += stats.get('errors', 0)
 
                 except Exception as e:
-                    self.error_occurred.emit(f"Error indexing {directory}: {str(e)}")
+                    self.error_occurred.emit(f"Error indexing {', '.join(directories)}: {str(e)}")
 
             # Optimize index
-            if not self.cancelled:
+            if not self.cancel_event.is_set():
                 self.indexer.optimize_index()
 
-            self.finished_indexing.emit(total_stats)
+            self.finished_indexing.emit(
+                total_stats['indexed'], total_stats['skipped'], total_stats['errors']
+            )
 
         except Exception as e:
             self.error_occurred.emit(str(e))
+            # Always end in the finished state so the dialog doesn't hang
+            self.finished_indexing.emit(
+                total_stats['indexed'], total_stats['skipped'], total_stats['errors']
+            )
 
     def _progress_callback(self, current: int, total: int, filename: str):
         """Progress callback.
 
+        Called by the indexer once per file while it writes documents, after
+        the os.scandir walk has gathered every file with its stat; keep it
+        cheap.
+
         Args:
             current: Current file number
             total: Total files
             filename: Current filename
         """
-        if not self.cancelled:
-            self.progress_updated.emit(current, total, filename)
+        self._progress = (current, total, filename)
+
+    def _emit_progress(self):
+        """Send the latest progress to the GUI if it moved since last time."""
+        progress = self._progress
+        if progress is not None and progress != self._emitted_progress and not self.cancel_event.is_set():
+            self._emitted_progress = progress
+            self.progress_updated.emit(*progress)
 
     def cancel(self):
         """Cancel indexing."""
-        self.cancelled = True
+        self.cancel_event.set()
 
 
 class IndexingDialog(QDialog):
@@ -91,12 +143,15 @@ class IndexingDialog(QDialog):
         Args:
             app_controller: Application controller
             parent: Parent widget
-            reindex: Whether to reindex (clear first)
+            reindex: Whether to reindex all watched directories
         """
         super().__init__(parent)
         self.app_controller = app_controller
         self.reindex = reindex
         self.indexing_thread = None
+        self._last_pct = -1
+        self._last_filename = None
+        self._had_error = False
 
         self.setWindowTitle("Index Directories" if not reindex else "Reindex All")
         self.setMinimumWidth(600)
@@ -105,10 +160,6 @@ class IndexingDialog(QDialog):
 
         self._init_ui()
 
-        if reindex:
-            # Start indexing immediately
-            self._start_indexing()
-
     def _init_ui(self):
         """Initialize user interface."""
         layout = QVBoxLayout()
@@ -119,9 +170,10 @@ class IndexingDialog(QDialog):
             dir_label = QLabel("Select directories to index:")
             layout.addWidget(dir_label)
 
-            # Directory list
+            # Directory list, plus its resolved paths for duplicate checks
             self.dir_list = QListWidget()
             layout.addWidget(self.dir_list)
+            self._dir_set = set()
 
             # Directory buttons
             dir_buttons_layout = QHBoxLayout()
@@ -137,6 +189,11 @@ class IndexingDialog(QDialog):
 
             dir_buttons_layout.addStretch()
 
+        if self.reindex:
+            # Reindexing is incremental unless a full rebuild is requested
+            self.force_full_checkbox = QCheckBox("Force full reindex")
+            layout.addWidget(self.force_full_checkbox)
+
         # Progress section
         progress_label = QLabel("Progress:")
         layout.addWidget(progress_label)
@@ -154,11 +211,27 @@ class IndexingDialog(QDialog):
         log_label = QLabel("Log:")
         layout.addWidget(log_label)
 
-        self.log_text = QTextEdit()
+        # Plain-text log that drops its oldest lines past the block limit
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setUndoRedoEnabled(False)
+        self.log_text.setMaximumBlockCount(500)
+        self.log_text.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.log_text.setMaximumHeight(150)
         layout.addWidget(self.log_text)
 
+        # Log lines are buffered and appended to the widget periodically
+        self._log_buf = deque(maxlen=200)
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(250)
+        self._log_timer.timeout.connect(self._flush_log)
+
+        # Progress widgets are refreshed at most every 30 ms
+        self._pending = None
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(30)
+        self._ui_timer.timeout.connect(self._flush_progress)
+
         # Buttons
         button_layout = QHBoxLayout()
         layout.addLayout(button_layout)
@@ -166,16 +239,29 @@ class IndexingDialog(QDialog):
         button_layout.addStretch()
 
         # Start/Cancel button
-        self.action_button = QPushButton("Start Indexing" if not self.reindex else "Cancel")
+        self.action_button = QPushButton("Start Indexing")
         self.action_button.clicked.connect(self._on_action_button)
         button_layout.addWidget(self.action_button)
 
         # Close button
         self.close_button = QPushButton("Close")
         self.close_button.clicked.connect(self.reject)
-        self.close_button.setEnabled(not self.reindex)
         button_layout.addWidget(self.close_button)
 
+    def _log(self, message: str):
+        """Queue a line for the log area.
+
+        Args:
+            message: Log line
+        """
+        self._log_buf.append(message)
+
+    def _flush_log(self):
+        """Append buffered log lines to the log area."""
+        if self._log_buf:
+            self.log_text.appendPlainText("\n".join(self._log_buf))
+            self._log_buf.clear()
+
     def _add_directory(self):
         """Add directory to index list."""
         directory = QFileDialog.getExistingDirectory(
@@ -185,24 +271,27 @@ class IndexingDialog(QDialog):
         )
 
         if directory:
-            # Check if already in list
-            for i in range(self.dir_list.count()):
-                if self.dir_list.item(i).text() == directory:
-                    return
+            # Resolve so that the same directory spelled differently
+            # isn't indexed twice
+            key = str(Path(directory).resolve())
+            if key in self._dir_set:
+                return
 
-            self.dir_list.addItem(directory)
+            self._dir_set.add(key)
+            self.dir_list.addItem(key)
 
     def _remove_directory(self):
         """Remove directory from list."""
         current_item = self.dir_list.currentItem()
         if current_item:
+            self._dir_set.discard(current_item.text())
             self.dir_list.takeItem(self.dir_list.row(current_item))
 
     def _on_action_button(self):
         """Handle action button click."""
         if self.indexing_thread and self.indexing_thread.isRunning():
             # Cancel indexing
-            self.log_text.append("Cancelling...")
+            self._log("Cancelling...")
             self.indexing_thread.cancel()
             self.action_button.setEnabled(False)
         else:
@@ -223,9 +312,7 @@ class IndexingDialog(QDialog):
                 self.reject()
                 return
         else:
-            directories = []
-            for i in range(self.dir_list.count()):
-                directories.append(self.dir_list.item(i).text())
+            directories = sorted(self._dir_set)
 
             if not directories:
                 QMessageBox.warning(
@@ -235,21 +322,35 @@ class IndexingDialog(QDialog):
                 )
                 return
 
+        # Directories inside another selected one would be walked twice
+        directories, nested = self._outermost_directories(directories)
+
         # Disable controls
         if hasattr(self, 'dir_list'):
             self.dir_list.setEnabled(False)
         self.action_button.setText("Cancel")
         self.close_button.setEnabled(False)
 
+        self._last_pct = -1
+        self._last_filename = None
+        self._had_error = False
+
         # Clear log
+        self._log_buf.clear()
         self.log_text.clear()
-        self.log_text.append(f"Starting indexing of {len(directories)} director{'y' if len(directories) == 1 else 'ies'}...")
+        for directory in nested:
+            self._log(f"Skipping {directory}: already covered by another directory")
+        self._log(f"Starting indexing of {len(directories)} director{'y' if len(directories) == 1 else 'ies'}...")
 
         # Create and start thread
+        force_full = self.reindex and self.force_full_checkbox.isChecked()
+        if hasattr(self, 'force_full_checkbox'):
+            self.force_full_checkbox.setEnabled(False)
         self.indexing_thread = IndexingThread(
             self.app_controller.indexer,
             directories,
-            self.reindex
+            self.reindex,
+            force_full
         )
 
         self.indexing_thread.progress_updated.connect(self._on_progress)
@@ -257,38 +358,86 @@ class IndexingDialog(QDialog):
         self.indexing_thread.error_occurred.connect(self._on_error)
 
         self.indexing_thread.start()
+        self._flush_log()
+        self._log_timer.start()
+        self._ui_timer.start()
+
+    @staticmethod
+    def _outermost_directories(directories):
+        """Resolve directories and drop those nested inside another.
+
+        Args:
+            directories: Directory paths
+
+        Returns:
+            Tuple of (directories to index, nested directories dropped)
+        """
+        kept = []
+        nested = []
+        for directory in sorted({str(Path(d).resolve()) for d in directories}):
+            if directory.startswith(tuple(os.path.join(k, '') for k in kept)):
+                nested.append(directory)
+            else:
+                kept.append(directory)
+        return kept, nested
 
     def _on_progress(self, current: int, total: int, filename: str):
         """Handle progress update.
 
+        Only records the update; _flush_progress applies the latest one, so
+        a backlog of queued signals costs no repaints.
+
         Args:
             current: Current file number
             total: Total files
             filename: Current filename
         """
-        if total > 0:
-            percentage = int((current / total) * 100)
-            self.progress_bar.setValue(percentage)
+        self._pending = (current, total, filename)
+
+    def _flush_progress(self):
+        """Show the most recent progress update, if any."""
+        if self._pending is None:
+            return
+        current, total, filename = self._pending
+        self._pending = None
+
+        percentage = current * 100 // total if total > 0 else self._last_pct
+        if percentage == self._last_pct and filename == self._last_filename:
+            return
+        self._last_filename = filename
 
         # Truncate long filenames
-        if len(filename) > 80:
-            filename = "..." + filename[-77:]
+        filename = _ELLIPSIS + filename[-77:] if len(filename) > 80 else filename
 
+        # Repaint once for both widgets
+        self.setUpdatesEnabled(False)
+        if percentage != self._last_pct:
+            self._last_pct = percentage
+            self.progress_bar.setValue(percentage)
         self.status_label.setText(f"Indexing ({current}/{total}): {filename}")
+        self.setUpdatesEnabled(True)
 
-    def _on_finished(self, stats: dict):
+    def _on_finished(self, indexed: int, skipped: int, errors: int):
         """Handle indexing completion.
 
         Args:
-            stats: Indexing statistics
+            indexed: Number of files indexed
+            skipped: Number of unchanged files skipped
+            errors: Number of files that failed
         """
+        self._ui_timer.stop()
+        self._pending = None
         self.progress_bar.setValue(100)
-        self.status_label.setText("Indexing complete")
+        self.status_label.setText(
+            "Indexing finished with errors" if self._had_error else "Indexing complete"
+        )
 
-        self.log_text.append("\n=== Indexing Complete ===")
-        self.log_text.append(f"Files indexed: {stats['indexed']}")
-        self.log_text.append(f"Files skipped: {stats['skipped']}")
-        self.log_text.append(f"Errors: {stats['errors']}")
+        self._log("\n=== Indexing Complete ===")
+        self._log(f"Files indexed: {indexed}")
+        self._log(f"Files skipped: {skipped}")
+        self._log(f"Errors: {errors}")
+        self._log_timer.stop()
+        self._flush_log()
 
         # Re-enable controls
         if hasattr(self, 'dir_list'):
@@ -297,12 +446,19 @@ class IndexingDialog(QDialog):
         self.action_button.setEnabled(not self.reindex)
         self.close_button.setEnabled(True)
 
-        # Show success message
-        QMessageBox.information(
-            self,
-            "Indexing Complete",
-            f"Successfully indexed {stats['indexed']} files."
-        )
+        # Show result message
+        if self._had_error:
+            QMessageBox.warning(
+                self,
+                "Indexing Finished",
+                f"Indexed {indexed} files; see the log for errors."
+            )
+        else:
+            QMessageBox.information(
+                self,
+                "Indexing Complete",
+                f"Successfully indexed {indexed} files."
+            )
 
         if self.reindex:
             self.accept()
@@ -313,7 +469,8 @@ class IndexingDialog(QDialog):
         Args:
             error_msg: Error message
         """
-        self.log_text.append(f"ERROR: {error_msg}")
+        self._had_error = True
+        self._log(f"ERROR: {error_msg}")
         self.status_label.setText("Error occurred")
 
     def closeEvent(self, event):
@@ -323,19 +480,12 @@ class IndexingDialog(QDialog):
             event: Close event
         """
         if self.indexing_thread and self.indexing_thread.isRunning():
-            reply = QMessageBox.question(
-                self,
-                "Cancel Indexing",
-                "Indexing is in progress. Cancel it?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.No
-            )
+            # Stop right away rather than asking first; the thread finishes
+            # its current file in the background
+            self.indexing_thread.cancel()
+            self.indexing_thread.finished_indexing.disconnect(self._on_finished)
+            self.status_label.setText("Cancelling...")
 
-            if reply == QMessageBox.Yes:
-                self.indexing_thread.cancel()
-                self.indexing_thread.wait()
-                event.accept()
-            else:
-                event.ignore()
-        else:
-            event.accept()
+        self._log_timer.stop()
+        self._ui_timer.stop()
+        event.accept()
@@ -2,13 +2,99 @@
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QStatusBar, QMenuBar, QMenu, QAction, QMessageBox,
-    QLabel, QProgressBar
+    QLabel, QProgressBar, QApplication
+)
+from PyQt5.QtCore import (
+    Qt, QObject, QThread, QTimer, QEvent, QMetaObject, pyqtSignal, pyqtSlot
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QIcon, QKeySequence
 import sys
 from pathlib import Path
 
+from .search_widget import SearchWidget
+from .results_widget import ResultsWidget
+from .indexing_dialog import IndexingDialog
+from .settings_dialog import SettingsDialog
+
+
+class IndexStatsPoller(QObject):
+    """Polls index statistics on a worker thread.
+
+    Counting documents opens an index reader, which touches the disk; doing
+    it from the GUI thread stalls the event loop.
+    """
+
+    # Document count, or -1 if the stats could not be read
+    stats_ready = pyqtSignal(int)
+
+    def __init__(self, app_controller, interval_ms: int = 5000):
+        """Initialize poller.
+
+        Args:
+            app_controller: Application controller instance
+            interval_ms: Polling interval in milliseconds
+        """
+        super().__init__()
+        self.app_controller = app_controller
+        self.interval_ms = interval_ms
+        self.timer = None
+        self._cached_count = 0
+
+    @pyqtSlot()
+    def start(self):
+        """Start polling; call from the thread the poller was moved to."""
+        # Created here so the timer lives in the worker thread
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.poll)
+        self.timer.start(self.interval_ms)
+        self.poll()
+
+    @pyqtSlot()
+    def pause(self):
+        """Stop polling until resume() is called."""
+        if self.timer is not None:
+            self.timer.stop()
+
+    @pyqtSlot()
+    def resume(self):
+        """Restart polling, refreshing the count right away."""
+        if self.timer is not None and not self.timer.isActive():
+            self.timer.start(self.interval_ms)
+            self.poll()
+
+    @pyqtSlot()
+    def poll(self):
+        """Read the index statistics and emit the document count."""
+        try:
+            stats = self.app_controller.get_index_stats()
+            self._cached_count = stats.get('document_count', 0)
+            self.stats_ready.emit(self._cached_count)
+        except Exception:
+            self.stats_ready.emit(-1)
+
+
+class NlpPreloadThread(QThread):
+    """Loads the NLP parser and its model off the GUI thread."""
+
+    model_ready = pyqtSignal()
+
+    def __init__(self, app_controller):
+        """Initialize preload thread.
+
+        Args:
+            app_controller: Application controller instance
+        """
+        super().__init__()
+        self.app_controller = app_controller
+
+    def run(self):
+        """Load the model, then announce it."""
+        try:
+            self.app_controller.preload_nlp()
+        except Exception as e:
+            print(f"Error loading NLP model: {e}")
+        self.model_ready.emit()
+
 
 class MainWindow(QMainWindow):
     """Main application window."""
@@ -27,6 +113,9 @@ class MainWindow(QMainWindow):
         self.app_controller = app_controller
         self.config = app_controller.config
 
+        # Indexing threads still stopping after their dialog was closed
+        self._indexing_threads = []
+
         self.setWindowTitle("FileSeekr - Smart File Search")
         self.resize(
             self.config.get('ui.window_width', 1000),
@@ -38,12 +127,15 @@ class MainWindow(QMainWindow):
         self._create_status_bar()
         self._connect_signals()
 
+        # Load spaCy in the background; searching works meanwhile and only
+        # entity queries wait for the model
+        self.search_widget.set_model_loading(True)
+        self.nlp_thread = NlpPreloadThread(self.app_controller)
+        self.nlp_thread.model_ready.connect(self.search_widget.model_ready)
+        self.nlp_thread.start()
+
     def _init_ui(self):
         """Initialize user interface."""
-        # Import here to avoid circular imports
-        from .search_widget import SearchWidget
-        from .results_widget import ResultsWidget
-
         # Central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -134,15 +226,27 @@ class MainWindow(QMainWindow):
         self.progress_bar = QProgressBar()
         self.progress_bar.setMaximumWidth(200)
         self.progress_bar.hide()
+        self._last_pct = -1
         self.status_bar.addPermanentWidget(self.progress_bar)
 
-        # Update index stats periodically
-        self.stats_timer = QTimer()
-        self.stats_timer.timeout.connect(self._update_index_stats)
-        self.stats_timer.start(5000)  # Update every 5 seconds
-
-        # Initial update
-        self._update_index_stats()
+        # Update index stats periodically, off the GUI thread
+        self.stats_thread = QThread(self)
+        self.stats_poller = IndexStatsPoller(self.app_controller, 5000)  # Every 5 seconds
+        self.stats_poller.moveToThread(self.stats_thread)
+        self.stats_thread.started.connect(self.stats_poller.start)
+        self.stats_poller.stats_ready.connect(self._update_index_stats)
+        self.stats_thread.start()
+
+        # In tray mode this window is closed and shown again, so the thread
+        # has to outlive it; it only stops when the application quits
+        QApplication.instance().aboutToQuit.connect(self._stop_index_stats)
+
+        # Polling pauses while the window is hidden, minimized or has been
+        # in the background for a while; nobody sees the count then
+        self.inactive_timer = QTimer(self)
+        self.inactive_timer.setSingleShot(True)
+        self.inactive_timer.setInterval(60000)
+        self.inactive_timer.timeout.connect(self._pause_index_stats)
 
     def _connect_signals(self):
         """Connect signals and slots."""
@@ -183,10 +287,31 @@ class MainWindow(QMainWindow):
 
     def _show_index_dialog(self):
         """Show indexing dialog."""
-        from .indexing_dialog import IndexingDialog
-
         dialog = IndexingDialog(self.app_controller, self)
         dialog.exec_()
+        self._track_indexing(dialog)
+
+    def _track_indexing(self, dialog):
+        """Keep a cancelled indexing thread alive until it winds down.
+
+        Args:
+            dialog: Closed IndexingDialog
+        """
+        thread = dialog.indexing_thread
+        if thread is not None and thread.isRunning():
+            self._indexing_threads.append(thread)
+            self.status_bar.showMessage("Cancelling indexing...")
+            thread.finished.connect(lambda: self._on_indexing_thread_done(thread))
+
+    def _on_indexing_thread_done(self, thread):
+        """Forget a finished indexing thread.
+
+        Args:
+            thread: Finished IndexingThread
+        """
+        if thread in self._indexing_threads:
+            self._indexing_threads.remove(thread)
+        self.status_bar.showMessage("Indexing cancelled", 3000)
 
     def _reindex_all(self):
         """Reindex all watched directories."""
@@ -201,9 +326,9 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             watch_paths = self.config.get('indexing.watch_paths', [])
             if watch_paths:
-                from .indexing_dialog import IndexingDialog
                 dialog = IndexingDialog(self.app_controller, self, reindex=True)
                 dialog.exec_()
+                self._track_indexing(dialog)
             else:
                 QMessageBox.information(
                     self,
@@ -214,8 +339,6 @@ class MainWindow(QMainWindow):
 
     def _show_settings(self):
         """Show settings dialog."""
-        from .settings_dialog import SettingsDialog
-
         dialog = SettingsDialog(self.config, self)
         if dialog.exec_():
             # Settings were saved, apply them
@@ -257,14 +380,56 @@ class MainWindow(QMainWindow):
         """
         QMessageBox.information(self, "Search Tips", tips)
 
-    def _update_index_stats(self):
-        """Update index statistics in status bar."""
-        try:
-            stats = self.app_controller.get_index_stats()
-            count = stats.get('document_count', 0)
-            self.index_stats_label.setText(f"Index: {count:,} files")
-        except Exception as e:
+    def _update_index_stats(self, count: int):
+        """Update index statistics in status bar.
+
+        Args:
+            count: Indexed document count from the stats poller, or -1
+        """
+        if count < 0:
             self.index_stats_label.setText("Index: Error")
+        else:
+            self.index_stats_label.setText(f"Index: {count:,} files")
+
+    def _pause_index_stats(self):
+        """Pause index statistics polling."""
+        QMetaObject.invokeMethod(self.stats_poller, 'pause', Qt.QueuedConnection)
+
+    def _resume_index_stats(self):
+        """Resume index statistics polling."""
+        QMetaObject.invokeMethod(self.stats_poller, 'resume', Qt.QueuedConnection)
+
+    def _stop_index_stats(self):
+        """Stop the index statistics thread on application shutdown."""
+        self.stats_thread.quit()
+        self.stats_thread.wait()
+
+    def showEvent(self, event):
+        """Handle window show event."""
+        super().showEvent(event)
+        self._resume_index_stats()
+
+    def hideEvent(self, event):
+        """Handle window hide event."""
+        super().hideEvent(event)
+        self.inactive_timer.stop()
+        self._pause_index_stats()
+
+    def changeEvent(self, event):
+        """Handle window state and activation changes."""
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.inactive_timer.stop()
+                self._pause_index_stats()
+            else:
+                self._resume_index_stats()
+        elif event.type() == QEvent.ActivationChange:
+            if self.isActiveWindow():
+                self.inactive_timer.stop()
+                self._resume_index_stats()
+            elif not self.isMinimized():
+                self.inactive_timer.start()
 
     def show_progress(self, visible: bool = True):
         """Show or hide progress bar.
@@ -285,8 +450,10 @@ class MainWindow(QMainWindow):
             total: Total items
         """
         if total > 0:
-            percentage = int((current / total) * 100)
-            self.progress_bar.setValue(percentage)
+            percentage = current * 100 // total
+            if percentage != self._last_pct:
+                self._last_pct = percentage
+                self.progress_bar.setValue(percentage)
 
     def closeEvent(self, event):
         """Handle window close event."""
@@ -294,8 +461,21 @@ class MainWindow(QMainWindow):
         self.config.set('ui.window_width', self.width())
         self.config.set('ui.window_height', self.height())
 
-        # Stop file watcher
-        if hasattr(self.app_controller, 'file_watcher'):
-            self.app_controller.file_watcher.stop()
+        # Pause stats polling; the tray may show this window again
+        self.inactive_timer.stop()
+        self._pause_index_stats()
+
+        # spaCy loading can't be interrupted; let it finish
+        self.nlp_thread.wait()
+
+        # Give cancelled indexing a moment to commit before going away
+        for thread in list(self._indexing_threads):
+            thread.cancel()
+            if not thread.wait(3000):
+                thread.terminate()
+                thread.wait()
+
+        # The file watcher is stopped by AppController.shutdown(); in tray
+        # mode it keeps running while this window is closed
 
         event.accept()
@@ -1,13 +1,228 @@
 """Overlay search window for quick access (like Spotlight)."""
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
-    QListWidget, QListWidgetItem, QLabel, QFrame,
-    QApplication
+    QListView, QLabel, QFrame, QApplication,
+    QStyledItemDelegate, QStyle
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QEvent, QRect
-from PyQt5.QtGui import QFont, QIcon, QPalette, QColor
+from PyQt5.QtCore import (
+    Qt, QTimer, pyqtSignal, QEvent, QRect, QObject, QRunnable, QThreadPool,
+    QAbstractListModel, QModelIndex, QVariant, QSize, QUrl
+)
+from PyQt5.QtGui import QFont, QFontMetrics, QIcon, QPalette, QColor, QDesktopServices
 import os
+import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+
+from ._format import format_size
+
+
+@lru_cache(maxsize=None)
+def _font(point_size: int = -1, bold: bool = False) -> QFont:
+    """Get a shared font; created on first use, after QApplication exists.
+
+    Args:
+        point_size: Point size, or -1 for the default
+        bold: Whether the font is bold
+
+    Returns:
+        QFont instance
+    """
+    font = QFont()
+    if point_size > 0:
+        font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
+
+class OverlayResultModel(QAbstractListModel):
+    """List model of overlay results with their display text preformatted."""
+
+    PathRole = Qt.UserRole
+    DirectoryRole = Qt.UserRole + 1
+    DetailsRole = Qt.UserRole + 2
+
+    def __init__(self, parent=None):
+        """Initialize model.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._rows = []  # (filename, directory, size/date, path)
+
+    @staticmethod
+    def format_rows(results: list) -> list:
+        """Preformat search results into display rows.
+
+        Done once per search, so a cached search is shown again without
+        reformatting.
+
+        Args:
+            results: List of search results
+
+        Returns:
+            List of (filename, directory, details, path) tuples
+        """
+        rows = []
+        for result in results:
+            # Truncate long paths
+            directory = result.directory
+            if len(directory) > 60:
+                directory = "..." + directory[-57:]
+
+            details = format_size(result.size)
+            if result.modified:
+                details += f"  •  {result.modified.strftime('%Y-%m-%d')}"
+
+            rows.append((result.filename, directory, details, result.path))
+        return rows
+
+    def set_rows(self, rows: list):
+        """Replace the listed results.
+
+        Args:
+            rows: Rows from format_rows
+        """
+        # While typing, new results often just extend or trim the previous
+        # ones; touch only the rows that changed so the view keeps the rest
+        old_rows = self._rows
+        common = min(len(old_rows), len(rows))
+        if old_rows[:common] != rows[:common]:
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+        elif len(rows) > len(old_rows):
+            self.beginInsertRows(QModelIndex(), len(old_rows), len(rows) - 1)
+            self._rows = rows
+            self.endInsertRows()
+        elif len(rows) < len(old_rows):
+            self.beginRemoveRows(QModelIndex(), len(rows), len(old_rows) - 1)
+            self._rows = rows
+            self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Number of results."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Filename, or the directory, details or path for the custom roles."""
+        if not index.isValid():
+            return QVariant()
+
+        filename, directory, details, path = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return filename
+        if role == self.DirectoryRole:
+            return directory
+        if role == self.DetailsRole:
+            return details
+        if role == self.PathRole:
+            return path
+        return QVariant()
+
+
+class OverlayResultDelegate(QStyledItemDelegate):
+    """Paints a result as filename, directory and size/date lines."""
+
+    PADDING = 12
+
+    def __init__(self, parent=None):
+        """Initialize delegate.
+
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._name_font = _font(bold=True)
+        self._detail_font = _font(8)
+
+    def sizeHint(self, option, index) -> QSize:
+        """Fixed row size fitting the three lines."""
+        height = (
+            QFontMetrics(self._name_font).height()
+            + option.fontMetrics.height()
+            + QFontMetrics(self._detail_font).height()
+            + 2 * self.PADDING
+        )
+        return QSize(option.rect.width(), height)
+
+    def paint(self, painter, option, index):
+        """Draw the row background and its three lines of text."""
+        # Background, selection and hover come from the widget's stylesheet
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        selected = option.state & QStyle.State_Selected
+        rect = option.rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING)
+
+        painter.save()
+        lines = (
+            (self._name_font, QColor("white") if selected else QColor("#333"), index.data(Qt.DisplayRole)),
+            (option.font, QColor("white") if selected else QColor("#777"),
+             index.data(OverlayResultModel.DirectoryRole)),
+            (self._detail_font, QColor("white") if selected else QColor("#999"),
+             index.data(OverlayResultModel.DetailsRole)),
+        )
+        y = rect.top()
+        for font, color, text in lines:
+            metrics = QFontMetrics(font)
+            painter.setFont(font)
+            painter.setPen(color)
+            line_rect = QRect(rect.left(), y, rect.width(), metrics.height())
+            painter.drawText(
+                line_rect, Qt.AlignLeft | Qt.AlignVCenter,
+                metrics.elidedText(text, Qt.ElideRight, rect.width())
+            )
+            y += metrics.height()
+        painter.restore()
+
+
+class SearchSignals(QObject):
+    """Signals for SearchRunnable, which can't define its own."""
+
+    finished = pyqtSignal(int, object, int, object)  # generation, key, version, rows
+    failed = pyqtSignal(int, str)  # generation, error message
+
+
+class SearchRunnable(QRunnable):
+    """Runs one overlay search on a thread pool."""
+
+    def __init__(self, generation, query, max_results, version, app_controller, signals, is_current):
+        """Initialize search task.
+
+        Args:
+            generation: Search generation number
+            query: Search query
+            max_results: Maximum number of results
+            version: Index version when the search was started
+            app_controller: Application controller instance
+            signals: SearchSignals to report through
+            is_current: Callable telling whether a generation is still wanted
+        """
+        super().__init__()
+        self.generation = generation
+        self.query = query
+        self.max_results = max_results
+        self.version = version
+        self.app_controller = app_controller
+        self.signals = signals
+        self.is_current = is_current
+
+    def run(self):
+        """Run the search unless a newer one has replaced it meanwhile."""
+        if not self.is_current(self.generation):
+            return
+
+        try:
+            results = self.app_controller.search(self.query, max_results=self.max_results)
+            rows = OverlayResultModel.format_rows(results)
+            self.signals.finished.emit(
+                self.generation, (self.query, self.max_results), self.version, rows
+            )
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
 
 
 class OverlaySearchWindow(QWidget):
@@ -16,6 +231,18 @@ class OverlaySearchWindow(QWidget):
     # Signals
     file_selected = pyqtSignal(str)
 
+    MAX_RESULTS = 20
+
+    # Recent searches, so retyping or backspacing to a query is instant
+    _CACHE_MAX = 32
+    _CACHE_TTL = 60  # seconds
+
+    # Single characters match too broadly to be worth searching; short
+    # queries wait longer for the next keystroke than long, selective ones
+    _MIN_QUERY_LEN = 2
+    _DEBOUNCE_MS_SHORT = 400
+    _DEBOUNCE_MS_LONG = 200
+
     def __init__(self, app_controller):
         """Initialize overlay window.
 
@@ -24,10 +251,30 @@ class OverlaySearchWindow(QWidget):
         """
         super().__init__()
         self.app_controller = app_controller
+        self._visible = False
         self.search_timer = QTimer()
         self.search_timer.setSingleShot(True)
         self.search_timer.timeout.connect(self._perform_search)
 
+        # (query, max_results) -> (time, index version, display rows)
+        self._search_cache = OrderedDict()
+
+        # Searches run one at a time on a worker; each gets a generation
+        # number and only the newest one's results are shown
+        self._search_generation = 0
+        self._search_pool = QThreadPool(self)
+        self._search_pool.setMaxThreadCount(1)
+        self._search_signals = SearchSignals(self)
+        self._search_signals.finished.connect(self._on_search_finished)
+        self._search_signals.failed.connect(self._on_search_failed)
+
+        # Keys handled by the event filter: Escape closes, Up/Down navigate
+        self._key_table = {
+            Qt.Key_Escape: type(self).hide_overlay,
+            Qt.Key_Down: type(self)._nav_down,
+            Qt.Key_Up: type(self)._nav_up,
+        }
+
         self._init_ui()
         self._apply_styles()
 
@@ -63,10 +310,7 @@ class OverlaySearchWindow(QWidget):
 
         title_label = QLabel("FileSeekr")
         title_label.setObjectName("title")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_font(16, bold=True))
         title_layout.addWidget(title_label)
 
         title_layout.addStretch()
@@ -74,9 +318,7 @@ class OverlaySearchWindow(QWidget):
         # Hotkey hint
         hint_label = QLabel("Ctrl+Shift+Space")
         hint_label.setObjectName("hint")
-        hint_font = QFont()
-        hint_font.setPointSize(9)
-        hint_label.setFont(hint_font)
+        hint_label.setFont(_font(9))
         title_layout.addWidget(hint_label)
 
         # Search input
@@ -87,19 +329,21 @@ class OverlaySearchWindow(QWidget):
         self.search_input.returnPressed.connect(self._on_return_pressed)
 
         # Make search input larger
-        search_font = QFont()
-        search_font.setPointSize(14)
-        self.search_input.setFont(search_font)
+        self.search_input.setFont(_font(14))
         self.search_input.setMinimumHeight(45)
 
         container_layout.addWidget(self.search_input)
 
         # Results list
-        self.results_list = QListWidget()
+        self.results_model = OverlayResultModel(self)
+        self.results_list = QListView()
         self.results_list.setObjectName("resultsList")
+        self.results_list.setModel(self.results_model)
+        self.results_list.setItemDelegate(OverlayResultDelegate(self.results_list))
+        self.results_list.setUniformItemSizes(True)
         self.results_list.setMinimumHeight(400)
-        self.results_list.itemDoubleClicked.connect(self._on_item_activated)
-        self.results_list.itemActivated.connect(self._on_item_activated)
+        self.results_list.doubleClicked.connect(self._on_item_activated)
+        self.results_list.activated.connect(self._on_item_activated)
 
         # Enable keyboard navigation
         self.results_list.setFocusPolicy(Qt.NoFocus)
@@ -109,9 +353,7 @@ class OverlaySearchWindow(QWidget):
         # Status bar
         self.status_label = QLabel("")
         self.status_label.setObjectName("status")
-        status_font = QFont()
-        status_font.setPointSize(9)
-        self.status_label.setFont(status_font)
+        self.status_label.setFont(_font(9))
         container_layout.addWidget(self.status_label)
 
         # Install event filter for Escape key
@@ -154,24 +396,24 @@ class OverlaySearchWindow(QWidget):
                 background-color: white;
             }
 
-            QListWidget#resultsList {
+            QListView#resultsList {
                 border: 1px solid #e0e0e0;
                 border-radius: 8px;
                 background-color: #fafafa;
                 outline: none;
             }
 
-            QListWidget#resultsList::item {
+            QListView#resultsList::item {
                 padding: 12px;
                 border-bottom: 1px solid #f0f0f0;
             }
 
-            QListWidget#resultsList::item:selected {
+            QListView#resultsList::item:selected {
                 background-color: #4CAF50;
                 color: white;
             }
 
-            QListWidget#resultsList::item:hover {
+            QListView#resultsList::item:hover {
                 background-color: #e8f5e9;
             }
 
@@ -186,113 +428,146 @@ class OverlaySearchWindow(QWidget):
         Args:
             text: Search text
         """
-        # Debounce search (wait 300ms after typing stops)
+        # Debounce search (wait until typing stops)
         self.search_timer.stop()
-        if text.strip():
-            self.search_timer.start(300)
+        query = text.strip()
+        if len(query) >= self._MIN_QUERY_LEN:
+            self.search_timer.start(
+                self._DEBOUNCE_MS_SHORT if len(query) < 4 else self._DEBOUNCE_MS_LONG
+            )
         else:
-            self.results_list.clear()
+            self._search_generation += 1  # Ignore searches still running
+            self.results_model.set_rows([])
             self.status_label.setText("")
 
     def _perform_search(self):
-        """Perform the actual search."""
+        """Start a search for the current query."""
         query = self.search_input.text().strip()
-        if not query:
+        if len(query) < self._MIN_QUERY_LEN:
             return
 
-        try:
-            # Perform search
-            results = self.app_controller.search(query, max_results=20)
-
-            # Clear previous results
-            self.results_list.clear()
-
-            # Display results
-            if results:
-                for result in results:
-                    item = QListWidgetItem()
+        key = (query, self.MAX_RESULTS)
+        version = self.app_controller.indexer.version
+        entry = self._search_cache.get(key)
+        if entry and time.monotonic() - entry[0] < self._CACHE_TTL and entry[1] == version:
+            self._search_cache.move_to_end(key)
+            self._search_generation += 1  # Supersede any search in flight
+            self._show_results(entry[2])
+            return
 
-                    # Format display text
-                    filename = result.filename
-                    directory = result.directory
+        # Search off the GUI thread so typing stays responsive; results for
+        # anything but the latest query are dropped
+        self._search_generation += 1
+        self._search_pool.start(SearchRunnable(
+            self._search_generation,
+            query,
+            self.MAX_RESULTS,
+            version,
+            self.app_controller,
+            self._search_signals,
+            lambda generation: generation == self._search_generation
+        ))
+
+    def _on_search_finished(self, generation: int, key: tuple, version: int, rows: list):
+        """Handle results from a background search.
 
-                    # Truncate long paths
-                    if len(directory) > 60:
-                        directory = "..." + directory[-57:]
+        Args:
+            generation: Search generation the results belong to
+            key: (query, max_results) searched for
+            version: Index version when the search started
+            rows: Formatted result rows
+        """
+        # Cache even superseded results; the user may come back to them
+        self._search_cache[key] = (time.monotonic(), version, rows)
+        self._search_cache.move_to_end(key)
+        if len(self._search_cache) > self._CACHE_MAX:
+            self._search_cache.popitem(last=False)
 
-                    # Main text: filename
-                    # Secondary text: directory and size
-                    size_str = self._format_size(result.size)
-                    modified_str = ""
-                    if result.modified:
-                        modified_str = result.modified.strftime("%Y-%m-%d")
+        if generation == self._search_generation:
+            self._show_results(rows)
 
-                    display_text = f"{filename}\n{directory}"
-                    if size_str or modified_str:
-                        display_text += f"\n{size_str}"
-                        if modified_str:
-                            display_text += f"  •  {modified_str}"
+    def _on_search_failed(self, generation: int, error_msg: str):
+        """Handle a failed background search.
 
-                    item.setText(display_text)
-                    item.setData(Qt.UserRole, result.path)
+        Args:
+            generation: Search generation that failed
+            error_msg: Error message
+        """
+        if generation == self._search_generation:
+            self.status_label.setText(f"Error: {error_msg}")
 
-                    self.results_list.addItem(item)
+    def _show_results(self, rows: list):
+        """Display search results.
 
-                # Select first item
-                self.results_list.setCurrentRow(0)
+        Args:
+            rows: Formatted result rows
+        """
+        self.results_model.set_rows(rows)
 
-                # Update status
-                self.status_label.setText(f"Found {len(results)} result(s)")
+        # Display results
+        if rows:
+            # Select first item
+            self._select_row(0)
 
-            else:
-                self.status_label.setText("No results found")
+            # Update status
+            self.status_label.setText(f"Found {len(rows)} result(s)")
 
-        except Exception as e:
-            self.status_label.setText(f"Error: {str(e)}")
+        else:
+            self.status_label.setText("No results found")
 
-    def _format_size(self, size_bytes: int) -> str:
-        """Format file size.
+    def _select_row(self, row: int):
+        """Make a result row current.
 
         Args:
-            size_bytes: Size in bytes
-
-        Returns:
-            Formatted size string
+            row: Row to select
         """
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        self.results_list.setCurrentIndex(self.results_model.index(row))
 
     def _on_return_pressed(self):
         """Handle Enter key in search input."""
         # Activate selected item or first item
-        current_item = self.results_list.currentItem()
-        if current_item:
-            self._on_item_activated(current_item)
-        elif self.results_list.count() > 0:
-            self._on_item_activated(self.results_list.item(0))
+        current_index = self.results_list.currentIndex()
+        if current_index.isValid():
+            self._on_item_activated(current_index)
+        elif self.results_model.rowCount() > 0:
+            self._on_item_activated(self.results_model.index(0))
 
-    def _on_item_activated(self, item: QListWidgetItem):
+    def _on_item_activated(self, index: QModelIndex):
         """Handle item activation (double-click or Enter).
 
         Args:
-            item: Activated item
+            index: Activated result index
         """
-        file_path = item.data(Qt.UserRole)
-        if file_path and os.path.exists(file_path):
-            # Open file
-            from PyQt5.QtCore import QUrl
-            from PyQt5.QtGui import QDesktopServices
-
-            QDesktopServices.openUrl(QUrl.fromLocalFile(file_path))
+        file_path = index.data(OverlayResultModel.PathRole)
+        if not file_path:
+            return
 
+        # Open file
+        if QDesktopServices.openUrl(QUrl.fromLocalFile(file_path)):
             # Emit signal
             self.file_selected.emit(file_path)
 
             # Hide window
             self.hide_overlay()
+        elif not os.path.exists(file_path):
+            self.status_label.setText("File no longer exists")
+        else:
+            self.status_label.setText("Could not open file")
+
+    def _nav_down(self):
+        """Select the next result, if any."""
+        count = self.results_model.rowCount()
+        if count > 0:
+            current_row = self.results_list.currentIndex().row()
+            if current_row < count - 1:
+                self._select_row(current_row + 1)
+
+    def _nav_up(self):
+        """Select the previous result, if any."""
+        if self.results_model.rowCount() > 0:
+            current_row = self.results_list.currentIndex().row()
+            if current_row > 0:
+                self._select_row(current_row - 1)
 
     def eventFilter(self, obj, event):
         """Filter events for keyboard shortcuts.
@@ -305,32 +580,40 @@ class OverlaySearchWindow(QWidget):
             True if event handled
         """
         if event.type() == QEvent.KeyPress:
-            key = event.key()
-
-            # Escape to close
-            if key == Qt.Key_Escape:
-                self.hide_overlay()
+            handler = self._key_table.get(event.key())
+            if handler:
+                handler(self)
                 return True
 
-            # Up/Down for navigation
-            elif key == Qt.Key_Down:
-                if self.results_list.count() > 0:
-                    current_row = self.results_list.currentRow()
-                    if current_row < self.results_list.count() - 1:
-                        self.results_list.setCurrentRow(current_row + 1)
-                return True
+        return super().eventFilter(obj, event)
 
-            elif key == Qt.Key_Up:
-                if self.results_list.count() > 0:
-                    current_row = self.results_list.currentRow()
-                    if current_row > 0:
-                        self.results_list.setCurrentRow(current_row - 1)
-                return True
+    def showEvent(self, event):
+        """Track that the overlay is shown.
 
-        return super().eventFilter(obj, event)
+        Args:
+            event: Show event
+        """
+        self._visible = True
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        """Track that the overlay is hidden.
+
+        Args:
+            event: Hide event
+        """
+        self._visible = False
+        super().hideEvent(event)
 
     def show_overlay(self):
         """Show the overlay window centered on screen."""
+        # Already up: just bring it forward, keeping the current search
+        if self._visible:
+            self.raise_()
+            self.activateWindow()
+            self.search_input.setFocus()
+            return
+
         # Center on screen
         screen = QApplication.primaryScreen()
         screen_geometry = screen.geometry()
@@ -341,8 +624,9 @@ class OverlaySearchWindow(QWidget):
         self.move(x, y)
 
         # Clear previous search
+        self._search_generation += 1
         self.search_input.clear()
-        self.results_list.clear()
+        self.results_model.set_rows([])
         self.status_label.setText("")
 
         # Show and focus
@@ -357,7 +641,7 @@ class OverlaySearchWindow(QWidget):
 
     def toggle_overlay(self):
         """Toggle overlay visibility."""
-        if self.isVisible():
+        if self._visible:
             self.hide_overlay()
         else:
             self.show_overlay()
@@ -1,14 +1,142 @@
 """Results widget for displaying search results."""
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-    QTableWidgetItem, QHeaderView, QLabel, QPushButton,
-    QMenu, QMessageBox, QAbstractItemView
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+    QHeaderView, QLabel, QPushButton,
+    QMenu, QMessageBox, QAbstractItemView, QApplication, QFileDialog
+)
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QUrl, QAbstractTableModel, QModelIndex, QVariant
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QUrl
 from PyQt5.QtGui import QDesktopServices, QCursor
+import csv
 import os
+import time
 from datetime import datetime
-from pathlib import Path
+from functools import partial
+
+from ._format import format_size
+
+_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class ResultsTableModel(QAbstractTableModel):
+    """Table model over a list of search results.
+
+    Cells are produced on demand for the rows the view paints, rather than
+    building an item per cell up front.
+    """
+
+    HEADERS = ["Filename", "Directory", "Size", "Type", "Modified", "Score"]
+
+    def __init__(self, format_size, parent=None):
+        """Initialize model.
+
+        Args:
+            format_size: Function formatting a byte count for display
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._results = []
+        self._format_size = format_size
+
+        # Per-column display text and sort keys, built once per result set
+        # so painting and scrolling don't format anything
+        self._display = [[] for _ in self.HEADERS]
+        self._sort_keys = [[] for _ in self.HEADERS]
+
+    def set_results(self, results: list):
+        """Replace the displayed results.
+
+        Args:
+            results: List of SearchResult objects
+        """
+        format_size = self._format_size
+        filenames, dirs, sizes_fmt, types, mods_fmt, scores_fmt = [], [], [], [], [], []
+        names_lower, sizes, mods, scores = [], [], [], []
+        for result in results:
+            filenames.append(result.filename)
+            dirs.append(result.directory)
+            sizes_fmt.append(format_size(result.size))
+            types.append(result.filetype)
+            mods_fmt.append(result.modified.strftime("%Y-%m-%d %H:%M") if result.modified else "N/A")
+            scores_fmt.append(f"{result.score:.2f}")
+            names_lower.append(result.filename.lower())
+            sizes.append(result.size)
+            mods.append(result.modified or datetime.min)
+            scores.append(result.score)
+
+        self.beginResetModel()
+        self._results = results
+        self._display = [filenames, dirs, sizes_fmt, types, mods_fmt, scores_fmt]
+        self._sort_keys = [names_lower, dirs, sizes, types, mods, scores]
+        self.endResetModel()
+
+    def result(self, row: int):
+        """Get the result shown in a row.
+
+        Args:
+            row: Model row
+
+        Returns:
+            SearchResult object
+        """
+        return self._results[row]
+
+    def sort(self, column: int, order=Qt.AscendingOrder):
+        """Sort rows by a column's raw values.
+
+        Args:
+            column: Column to sort by
+            order: Qt.AscendingOrder or Qt.DescendingOrder
+        """
+        if not 0 <= column < len(self.HEADERS):
+            return
+
+        keys = self._sort_keys[column]
+        order_rows = sorted(
+            range(len(self._results)),
+            key=keys.__getitem__,
+            reverse=(order == Qt.DescendingOrder)
+        )
+
+        self.layoutAboutToBeChanged.emit()
+        self._results = [self._results[i] for i in order_rows]
+        self._display = [[values[i] for i in order_rows] for values in self._display]
+        self._sort_keys = [[values[i] for i in order_rows] for values in self._sort_keys]
+
+        # Keep the selection on the same results
+        new_rows = {old_row: new_row for new_row, old_row in enumerate(order_rows)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(old_indexes, [
+            self.index(new_rows[index.row()], index.column()) for index in old_indexes
+        ])
+        self.layoutChanged.emit()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Number of results."""
+        return 0 if parent.isValid() else len(self._results)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Number of columns."""
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Column titles."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return QVariant()
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Cell text, or the raw value for sorting under Qt.UserRole."""
+        if not index.isValid():
+            return QVariant()
+
+        if role == Qt.DisplayRole:
+            return self._display[index.column()][index.row()]
+        if role == Qt.UserRole:
+            return self._sort_keys[index.column()][index.row()]
+
+        return QVariant()
 
 
 class ResultsWidget(QWidget):
@@ -47,12 +175,11 @@ class ResultsWidget(QWidget):
         export_button.clicked.connect(self._export_results)
         header_layout.addWidget(export_button)
 
-        # Results table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "Filename", "Directory", "Size", "Type", "Modified", "Score"
-        ])
+        # Results table; the model sorts itself on raw values
+        self.model = ResultsTableModel(self._format_size, self)
+
+        self.table = QTableView()
+        self.table.setModel(self.model)
 
         # Table settings
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
@@ -91,56 +218,15 @@ class ResultsWidget(QWidget):
         self.results = results
         self.results_label.setText(f"Results: {len(results)}")
 
-        # Clear table
-        self.table.setRowCount(0)
-        self.table.setSortingEnabled(False)
-
-        # Populate table
-        for i, result in enumerate(results):
-            self.table.insertRow(i)
-
-            # Filename
-            filename_item = QTableWidgetItem(result.filename)
-            filename_item.setData(Qt.UserRole, result.path)
-            self.table.setItem(i, 0, filename_item)
-
-            # Directory
-            directory_item = QTableWidgetItem(result.directory)
-            self.table.setItem(i, 1, directory_item)
-
-            # Size
-            size_item = QTableWidgetItem(self._format_size(result.size))
-            size_item.setData(Qt.UserRole, result.size)
-            self.table.setItem(i, 2, size_item)
-
-            # Type
-            type_item = QTableWidgetItem(result.filetype)
-            self.table.setItem(i, 3, type_item)
-
-            # Modified
-            if result.modified:
-                modified_str = result.modified.strftime("%Y-%m-%d %H:%M")
-                modified_item = QTableWidgetItem(modified_str)
-                modified_item.setData(Qt.UserRole, result.modified)
-            else:
-                modified_item = QTableWidgetItem("N/A")
-            self.table.setItem(i, 4, modified_item)
-
-            # Score
-            score_item = QTableWidgetItem(f"{result.score:.2f}")
-            score_item.setData(Qt.UserRole, result.score)
-            self.table.setItem(i, 5, score_item)
-
-        # Re-enable sorting
-        self.table.setSortingEnabled(True)
+        self.model.set_results(results)
 
         # Sort by score (descending) by default
-        self.table.sortItems(5, Qt.DescendingOrder)
+        self.table.sortByColumn(5, Qt.DescendingOrder)
 
     def clear(self):
         """Clear all results."""
         self.results = []
-        self.table.setRowCount(0)
+        self.model.set_results([])
         self.results_label.setText("Results: 0")
 
     def _format_size(self, size_bytes: int) -> str:
@@ -152,11 +238,7 @@ class ResultsWidget(QWidget):
         Returns:
             Formatted size string
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} PB"
+        return format_size(size_bytes)
 
     def _on_double_click(self, index):
         """Handle double-click on result.
@@ -164,37 +246,48 @@ class ResultsWidget(QWidget):
         Args:
             index: Clicked index
         """
-        row = index.row()
-        path_item = self.table.item(row, 0)
-        if path_item:
-            file_path = path_item.data(Qt.UserRole)
+        file_path = self._path_at(index)
+        if file_path:
             self._open_file(file_path)
 
+    def _path_at(self, index) -> str:
+        """Get the file path of the result at a view index.
+
+        Args:
+            index: Index in the table view
+
+        Returns:
+            File path, or an empty string for an invalid index
+        """
+        if not index.isValid():
+            return ""
+        return self.model.result(index.row()).path
+
     def _open_file(self, file_path: str):
         """Open file with default application.
 
         Args:
             file_path: Path to file
         """
+        # Open with default application; only check the file exists if
+        # that fails, to tell the two errors apart
+        url = QUrl.fromLocalFile(file_path)
+        if QDesktopServices.openUrl(url):
+            self.file_opened.emit(file_path)
+            return
+
         if not os.path.exists(file_path):
             QMessageBox.warning(
                 self,
                 "File Not Found",
                 f"The file does not exist:\n{file_path}"
             )
-            return
-
-        # Open with default application
-        url = QUrl.fromLocalFile(file_path)
-        if not QDesktopServices.openUrl(url):
+        else:
             QMessageBox.warning(
                 self,
                 "Cannot Open File",
                 f"Could not open file:\n{file_path}"
             )
-            return
-
-        self.file_opened.emit(file_path)
 
     def _show_context_menu(self, position):
         """Show context menu for result.
@@ -203,27 +296,21 @@ class ResultsWidget(QWidget):
             position: Menu position
         """
         index = self.table.indexAt(position)
-        if not index.isValid():
-            return
-
-        row = index.row()
-        path_item = self.table.item(row, 0)
-        if not path_item:
+        file_path = self._path_at(index)
+        if not file_path:
             return
 
-        file_path = path_item.data(Qt.UserRole)
-
         # Create context menu
         menu = QMenu()
 
         # Open action
         open_action = menu.addAction("Open")
-        open_action.triggered.connect(lambda: self._open_file(file_path))
+        open_action.triggered.connect(partial(self._open_file, file_path))
 
         # Open location action
         open_location_action = menu.addAction("Open File Location")
         open_location_action.triggered.connect(
-            lambda: self._open_file_location(file_path)
+            partial(self._open_file_location, file_path)
         )
 
         menu.addSeparator()
@@ -231,14 +318,14 @@ class ResultsWidget(QWidget):
         # Copy path action
         copy_path_action = menu.addAction("Copy Path")
         copy_path_action.triggered.connect(
-            lambda: self._copy_path(file_path)
+            partial(self._copy_path, file_path)
         )
 
         # Copy filename action
         copy_filename_action = menu.addAction("Copy Filename")
         filename = os.path.basename(file_path)
         copy_filename_action.triggered.connect(
-            lambda: self._copy_path(filename)
+            partial(self._copy_path, filename)
         )
 
         menu.addSeparator()
@@ -246,7 +333,7 @@ class ResultsWidget(QWidget):
         # Properties action
         properties_action = menu.addAction("Properties...")
         properties_action.triggered.connect(
-            lambda: self._show_properties(file_path)
+            partial(self._show_properties, file_path)
         )
 
         # Show menu
@@ -268,7 +355,6 @@ class ResultsWidget(QWidget):
         Args:
             text: Text to copy
         """
-        from PyQt5.QtWidgets import QApplication
         clipboard = QApplication.clipboard()
         clipboard.setText(text)
 
@@ -278,20 +364,19 @@ class ResultsWidget(QWidget):
         Args:
             file_path: Path to file
         """
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
             QMessageBox.warning(self, "File Not Found", "The file does not exist.")
             return
 
-        stat = os.stat(file_path)
-        path_obj = Path(file_path)
-
         info = f"""
-        <b>File:</b> {path_obj.name}<br>
+        <b>File:</b> {os.path.basename(file_path)}<br>
         <b>Path:</b> {file_path}<br>
         <b>Size:</b> {self._format_size(stat.st_size)}<br>
-        <b>Created:</b> {datetime.fromtimestamp(stat.st_ctime).strftime("%Y-%m-%d %H:%M:%S")}<br>
-        <b>Modified:</b> {datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")}<br>
-        <b>Accessed:</b> {datetime.fromtimestamp(stat.st_atime).strftime("%Y-%m-%d %H:%M:%S")}
+        <b>Created:</b> {time.strftime(_TIME_FORMAT, time.localtime(stat.st_ctime))}<br>
+        <b>Modified:</b> {time.strftime(_TIME_FORMAT, time.localtime(stat.st_mtime))}<br>
+        <b>Accessed:</b> {time.strftime(_TIME_FORMAT, time.localtime(stat.st_atime))}
         """
 
         QMessageBox.information(self, "File Properties", info)
@@ -306,7 +391,6 @@ class ResultsWidget(QWidget):
             )
             return
 
-        from PyQt5.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Export Results",
@@ -335,9 +419,7 @@ class ResultsWidget(QWidget):
         Args:
             file_path: Output file path
         """
-        import csv
-
-        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        with open(file_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             writer = csv.writer(f)
 
             # Write header
@@ -347,15 +429,22 @@ class ResultsWidget(QWidget):
             ])
 
             # Write results
-            for result in self.results:
-                modified_str = result.modified.strftime("%Y-%m-%d %H:%M:%S") if result.modified else ""
-                writer.writerow([
-                    result.filename,
-                    result.path,
-                    result.directory,
-                    result.size,
-                    result.filetype,
-                    result.extension,
-                    modified_str,
-                    f"{result.score:.4f}"
-                ])
+            writer.writerows(self._iter_csv_rows())
+
+    def _iter_csv_rows(self):
+        """Yield CSV rows for the current results.
+
+        Yields:
+            Tuple of column values for one result
+        """
+        for result in self.results:
+            yield (
+                result.filename,
+                result.path,
+                result.directory,
+                result.size,
+                result.filetype,
+                result.extension,
+                result.modified.strftime("%Y-%m-%d %H:%M:%S") if result.modified else "",
+                f"{result.score:.4f}",
+            )
@@ -7,6 +7,15 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, pyqtSignal
 from PyQt5.QtGui import QKeySequence
 
+# Size filter choices, keyed by their combo box label
+_SIZE_FILTERS = {
+    "Any": {},
+    "Small (< 1MB)": {'size_max': 1024 * 1024},
+    "Medium (1-10MB)": {'size_min': 1024 * 1024, 'size_max': 10 * 1024 * 1024},
+    "Large (10-100MB)": {'size_min': 10 * 1024 * 1024, 'size_max': 100 * 1024 * 1024},
+    "Huge (> 100MB)": {'size_min': 100 * 1024 * 1024},
+}
+
 
 class SearchWidget(QWidget):
     """Widget for search input and filters."""
@@ -93,13 +102,7 @@ class SearchWidget(QWidget):
         filters_layout.addWidget(size_label)
 
         self.size_combo = QComboBox()
-        self.size_combo.addItems([
-            "Any",
-            "Small (< 1MB)",
-            "Medium (1-10MB)",
-            "Large (10-100MB)",
-            "Huge (> 100MB)"
-        ])
+        self.size_combo.addItems(list(_SIZE_FILTERS))
         filters_layout.addWidget(self.size_combo)
 
         # Fuzzy search checkbox
@@ -112,6 +115,24 @@ class SearchWidget(QWidget):
         # Set focus to search input
         self.search_input.setFocus()
 
+    def set_model_loading(self, loading: bool = True):
+        """Show whether the language model is still loading.
+
+        Only a hint: searching stays available, and queries that need the
+        model load it on demand.
+
+        Args:
+            loading: Whether the model is loading
+        """
+        self.search_input.setPlaceholderText(
+            "Loading language model..." if loading
+            else "Enter search query (supports natural language)..."
+        )
+
+    def model_ready(self):
+        """Handle the language model finishing loading."""
+        self.set_model_loading(False)
+
     def _on_search(self):
         """Handle search button click."""
         query = self.search_input.text().strip()
@@ -129,23 +150,12 @@ class SearchWidget(QWidget):
         # Extension
         extension = self.ext_input.text().strip()
         if extension:
-            if not extension.startswith('.'):
-                extension = '.' + extension
-            filters['extension'] = extension
+            filters['extension'] = extension if extension.startswith('.') else '.' + extension
 
         # Size
         size_text = self.size_combo.currentText()
-        if size_text != "Any":
-            if "Small" in size_text:
-                filters['size_max'] = 1024 * 1024
-            elif "Medium" in size_text:
-                filters['size_min'] = 1024 * 1024
-                filters['size_max'] = 10 * 1024 * 1024
-            elif "Large" in size_text:
-                filters['size_min'] = 10 * 1024 * 1024
-                filters['size_max'] = 100 * 1024 * 1024
-            elif "Huge" in size_text:
-                filters['size_min'] = 100 * 1024 * 1024
+        if size_text in _SIZE_FILTERS:
+            filters.update(_SIZE_FILTERS[size_text])
 
         # Emit search signal
         self.search_triggered.emit(query, filters)
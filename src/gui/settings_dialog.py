@@ -25,21 +25,36 @@ class SettingsDialog(QDialog):
         self.setMinimumHeight(500)
 
         self._init_ui()
-        self._load_settings()
 
     def _init_ui(self):
         """Initialize user interface."""
         layout = QVBoxLayout()
         self.setLayout(layout)
 
-        # Tab widget
-        tabs = QTabWidget()
-        layout.addWidget(tabs)
-
-        # Create tabs
-        tabs.addTab(self._create_indexing_tab(), "Indexing")
-        tabs.addTab(self._create_search_tab(), "Search")
-        tabs.addTab(self._create_ui_tab(), "Interface")
+        # Tab widget; each tab's controls are created and loaded the first
+        # time it is shown, so opening the dialog only builds the first one
+        self.tabs = QTabWidget()
+        layout.addWidget(self.tabs)
+
+        # (label, create, load, collect) per tab
+        self._tab_builders = [
+            ("Indexing", self._create_indexing_tab,
+             self._load_indexing_settings, self._collect_indexing_settings),
+            ("Search", self._create_search_tab,
+             self._load_search_settings, self._collect_search_settings),
+            ("Interface", self._create_ui_tab,
+             self._load_ui_settings, self._collect_ui_settings),
+        ]
+        self._built_tabs = set()
+
+        for label, _, _, _ in self._tab_builders:
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            self.tabs.addTab(placeholder, label)
+
+        self._build_tab(self.tabs.currentIndex())
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -62,6 +77,39 @@ class SettingsDialog(QDialog):
         apply_button.clicked.connect(self._apply_settings)
         button_layout.addWidget(apply_button)
 
+    def _build_tab(self, index: int):
+        """Create a tab's controls in its placeholder page.
+
+        Args:
+            index: Tab index
+        """
+        self.tabs.widget(index).layout().addWidget(self._tab_builders[index][1]())
+        self._built_tabs.add(index)
+
+    def _on_tab_changed(self, index: int):
+        """Build and load a tab the first time it is shown.
+
+        Args:
+            index: Tab index
+        """
+        if index < 0 or index in self._built_tabs:
+            return
+
+        self._build_tab(index)
+        self._tab_builders[index][2]()
+
+    def showEvent(self, event):
+        """Load current settings each time the dialog is shown.
+
+        The dialog may be kept and reopened, so edits that were cancelled
+        last time are discarded.
+
+        Args:
+            event: Show event
+        """
+        self._load_settings()
+        super().showEvent(event)
+
     def _create_indexing_tab(self) -> QWidget:
         """Create indexing settings tab.
 
@@ -191,8 +239,13 @@ class SettingsDialog(QDialog):
         return widget
 
     def _load_settings(self):
-        """Load current settings into UI."""
-        # Indexing tab
+        """Load current settings into the tabs built so far."""
+        for index in sorted(self._built_tabs):
+            self._tab_builders[index][2]()
+
+    def _load_indexing_settings(self):
+        """Load current indexing settings into UI."""
+        self.paths_list.clear()
         watch_paths = self.config.get('indexing.watch_paths', [])
         for path in watch_paths:
             self.paths_list.addItem(path)
@@ -210,7 +263,8 @@ class SettingsDialog(QDialog):
             self.config.get('indexing.index_interval_minutes', 60)
         )
 
-        # Search tab
+    def _load_search_settings(self):
+        """Load current search settings into UI."""
         self.max_results_spinbox.setValue(
             self.config.get('search.max_results', 100)
         )
@@ -224,41 +278,63 @@ class SettingsDialog(QDialog):
             self.config.get('search.snippet_size', 200)
         )
 
-        # UI tab
+    def _load_ui_settings(self):
+        """Load current interface settings into UI."""
         self.show_hidden_checkbox.setChecked(
             self.config.get('ui.show_hidden_files', False)
         )
 
     def _apply_settings(self):
-        """Apply settings to configuration."""
-        # Indexing settings
+        """Apply settings to configuration.
+
+        Only tabs that have been shown are applied; the others still hold
+        the configured values. The config file is written once.
+        """
+        values = {}
+        for index in sorted(self._built_tabs):
+            values.update(self._tab_builders[index][3]())
+        self.config.update(values)
+
+    def _collect_indexing_settings(self) -> dict:
+        """Collect indexing settings from UI.
+
+        Returns:
+            Dictionary of key path to value
+        """
         watch_paths = []
         for i in range(self.paths_list.count()):
             watch_paths.append(self.paths_list.item(i).text())
 
-        self.config.set('indexing.watch_paths', watch_paths)
-        self.config.set('indexing.auto_index_on_startup',
-                       self.auto_index_checkbox.isChecked())
-        self.config.set('index.watch_for_changes',
-                       self.watch_changes_checkbox.isChecked())
-        self.config.set('index.max_file_size_mb',
-                       self.max_size_spinbox.value())
-        self.config.set('indexing.index_interval_minutes',
-                       self.index_interval_spinbox.value())
-
-        # Search settings
-        self.config.set('search.max_results',
-                       self.max_results_spinbox.value())
-        self.config.set('search.enable_fuzzy',
-                       self.fuzzy_checkbox.isChecked())
-        self.config.set('search.fuzzy_distance',
-                       self.fuzzy_distance_spinbox.value())
-        self.config.set('search.snippet_size',
-                       self.snippet_size_spinbox.value())
-
-        # UI settings
-        self.config.set('ui.show_hidden_files',
-                       self.show_hidden_checkbox.isChecked())
+        return {
+            'indexing.watch_paths': watch_paths,
+            'indexing.auto_index_on_startup': self.auto_index_checkbox.isChecked(),
+            'index.watch_for_changes': self.watch_changes_checkbox.isChecked(),
+            'index.max_file_size_mb': self.max_size_spinbox.value(),
+            'indexing.index_interval_minutes': self.index_interval_spinbox.value(),
+        }
+
+    def _collect_search_settings(self) -> dict:
+        """Collect search settings from UI.
+
+        Returns:
+            Dictionary of key path to value
+        """
+        return {
+            'search.max_results': self.max_results_spinbox.value(),
+            'search.enable_fuzzy': self.fuzzy_checkbox.isChecked(),
+            'search.fuzzy_distance': self.fuzzy_distance_spinbox.value(),
+            'search.snippet_size': self.snippet_size_spinbox.value(),
+        }
+
+    def _collect_ui_settings(self) -> dict:
+        """Collect interface settings from UI.
+
+        Returns:
+            Dictionary of key path to value
+        """
+        return {
+            'ui.show_hidden_files': self.show_hidden_checkbox.isChecked(),
+        }
 
     def _add_watch_path(self):
         """Add a directory to watch list."""
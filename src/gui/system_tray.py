@@ -4,12 +4,14 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtGui import QIcon, QPixmap, QPainter, QColor, QPen
 from PyQt5.QtCore import Qt, QTimer
-import sys
 
 
 class SystemTrayApp:
     """System tray application for FileSeekr."""
 
+    # Rendered once, on first use after QApplication exists
+    _cached_icon = None
+
     def __init__(self, app_controller, overlay_window, hotkey_manager):
         """Initialize system tray app.
 
@@ -22,6 +24,7 @@ class SystemTrayApp:
         self.overlay_window = overlay_window
         self.hotkey_manager = hotkey_manager
         self.main_window = None
+        self._settings_dialog = None
 
         # Create system tray icon
         self.tray_icon = QSystemTrayIcon()
@@ -46,6 +49,9 @@ class SystemTrayApp:
         Returns:
             QIcon instance
         """
+        if SystemTrayApp._cached_icon is not None:
+            return SystemTrayApp._cached_icon
+
         # Create a simple icon (you can replace with actual icon file)
         pixmap = QPixmap(64, 64)
         pixmap.fill(Qt.transparent)
@@ -54,17 +60,20 @@ class SystemTrayApp:
         painter.setRenderHint(QPainter.Antialiasing)
 
         # Draw magnifying glass
+        color = QColor("#4CAF50")
+
         # Circle
-        painter.setPen(QPen(QColor("#4CAF50"), 6))
+        painter.setPen(QPen(color, 6))
         painter.drawEllipse(10, 10, 35, 35)
 
         # Handle
-        painter.setPen(QPen(QColor("#4CAF50"), 8))
+        painter.setPen(QPen(color, 8))
         painter.drawLine(38, 38, 55, 55)
 
         painter.end()
 
-        return QIcon(pixmap)
+        SystemTrayApp._cached_icon = QIcon(pixmap)
+        return SystemTrayApp._cached_icon
 
     def _create_menu(self):
         """Create system tray menu."""
@@ -115,13 +124,10 @@ class SystemTrayApp:
 
         self.tray_icon.setContextMenu(menu)
 
-        # Update stats periodically
-        self.stats_timer = QTimer()
-        self.stats_timer.timeout.connect(self._update_stats)
-        self.stats_timer.start(10000)  # Update every 10 seconds
-
-        # Initial update
-        QTimer.singleShot(500, self._update_stats)
+        # Refresh stats only when the menu is about to be seen, rather than
+        # querying the index on a timer while the app sits idle
+        self._last_stats_text = None
+        menu.aboutToShow.connect(self._update_stats)
 
     def _show_overlay(self):
         """Show overlay search window."""
@@ -148,12 +154,14 @@ class SystemTrayApp:
 
     def _show_settings(self):
         """Open settings dialog."""
-        # Ensure main window exists
-        if self.main_window is None:
-            self._show_main_window()
+        # Created on first use and kept, without building the main window
+        if self._settings_dialog is None:
+            from .settings_dialog import SettingsDialog
+            self._settings_dialog = SettingsDialog(self.app_controller.config)
 
-        # Show settings dialog
-        self.main_window._show_settings()
+        self._settings_dialog.show()
+        self._settings_dialog.raise_()
+        self._settings_dialog.activateWindow()
 
     def _show_about(self):
         """Show about dialog."""
@@ -172,9 +180,13 @@ class SystemTrayApp:
         try:
             stats = self.app_controller.get_index_stats()
             count = stats.get('document_count', 0)
-            self.stats_action.setText(f"Index: {count:,} files")
+            text = f"Index: {count:,} files"
         except Exception:
-            self.stats_action.setText("Index: Error")
+            text = "Index: Error"
+
+        if text != self._last_stats_text:
+            self._last_stats_text = text
+            self.stats_action.setText(text)
 
     def _on_tray_activated(self, reason):
         """Handle tray icon activation.
@@ -200,9 +212,5 @@ class SystemTrayApp:
         if self.hotkey_manager:
             self.hotkey_manager.stop()
 
-        # Stop file watcher
-        if hasattr(self.app_controller, 'file_watcher'):
-            self.app_controller.file_watcher.stop()
-
         # Quit application
         QApplication.quit()
@@ -2,8 +2,24 @@
 import os
 import sys
 import platform
+import plistlib
 from pathlib import Path
 
+# Per-user programs started at login on Windows
+_WINDOWS_RUN_KEY = r"Software\Microsoft\Windows\CurrentVersion\Run"
+
+# XDG autostart entry for Linux; only the command varies
+_LINUX_DESKTOP_TEMPLATE = """[Desktop Entry]
+Type=Application
+Name=FileSeekr
+Comment=Smart file search application
+Exec={exec_path}
+Icon=system-search
+Terminal=false
+Categories=Utility;
+X-GNOME-Autostart-enabled=true
+"""
+
 
 class AutoStartManager:
     """Manages application auto-start on system boot."""
@@ -17,19 +33,35 @@ class AutoStartManager:
         self.app_name = app_name
         self.system = platform.system()
 
+        # (is_enabled, enable, disable) for this platform, or None
+        self._ops = {
+            "Windows": (self._is_enabled_windows, self._enable_windows, self._disable_windows),
+            "Darwin": (self._is_enabled_macos, self._enable_macos, self._disable_macos),
+            "Linux": (self._is_enabled_linux, self._enable_linux, self._disable_linux),
+        }.get(self.system)
+
+        # Result of the last probe; kept up to date by enable()/disable()
+        self._enabled_cache = None
+
     def is_enabled(self) -> bool:
         """Check if auto-start is enabled.
 
         Returns:
             True if enabled
         """
-        if self.system == "Windows":
-            return self._is_enabled_windows()
-        elif self.system == "Darwin":
-            return self._is_enabled_macos()
-        elif self.system == "Linux":
-            return self._is_enabled_linux()
-        return False
+        if self._enabled_cache is None:
+            self._enabled_cache = self._probe_enabled()
+        return self._enabled_cache
+
+    def _probe_enabled(self) -> bool:
+        """Check the platform's auto-start entry.
+
+        Returns:
+            True if enabled
+        """
+        if self._ops is None:
+            return False
+        return self._ops[0]()
 
     def enable(self) -> bool:
         """Enable auto-start.
@@ -37,54 +69,48 @@ class AutoStartManager:
         Returns:
             True if successful
         """
-        try:
-            if self.system == "Windows":
-                return self._enable_windows()
-            elif self.system == "Darwin":
-                return self._enable_macos()
-            elif self.system == "Linux":
-                return self._enable_linux()
+        if self._ops is None:
             return False
+
+        try:
+            success = self._ops[1]()
         except Exception as e:
             print(f"Error enabling auto-start: {e}")
             return False
 
+        if success:
+            self._enabled_cache = True
+        return success
+
     def disable(self) -> bool:
         """Disable auto-start.
 
         Returns:
             True if successful
         """
-        try:
-            if self.system == "Windows":
-                return self._disable_windows()
-            elif self.system == "Darwin":
-                return self._disable_macos()
-            elif self.system == "Linux":
-                return self._disable_linux()
+        if self._ops is None:
             return False
+
+        try:
+            success = self._ops[2]()
         except Exception as e:
             print(f"Error disabling auto-start: {e}")
             return False
 
+        if success:
+            self._enabled_cache = False
+        return success
+
     # Windows implementation
     def _is_enabled_windows(self) -> bool:
         """Check if auto-start is enabled on Windows."""
         try:
             import winreg
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                r"Software\Microsoft\Windows\CurrentVersion\Run",
-                0,
-                winreg.KEY_READ
-            )
-            try:
+            with winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER, _WINDOWS_RUN_KEY, 0, winreg.KEY_READ
+            ) as key:
                 winreg.QueryValueEx(key, self.app_name)
-                winreg.CloseKey(key)
-                return True
-            except FileNotFoundError:
-                winreg.CloseKey(key)
-                return False
+            return True
         except Exception:
             return False
 
@@ -101,17 +127,11 @@ class AutoStartManager:
                 # Running as script
                 exe_path = f'"{sys.executable}" "{os.path.abspath(sys.argv[0])}"'
 
-            # Open registry key
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                r"Software\Microsoft\Windows\CurrentVersion\Run",
-                0,
-                winreg.KEY_WRITE
-            )
-
             # Set value
-            winreg.SetValueEx(key, self.app_name, 0, winreg.REG_SZ, exe_path)
-            winreg.CloseKey(key)
+            with winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER, _WINDOWS_RUN_KEY, 0, winreg.KEY_WRITE
+            ) as key:
+                winreg.SetValueEx(key, self.app_name, 0, winreg.REG_SZ, exe_path)
 
             return True
         except Exception as e:
@@ -122,17 +142,13 @@ class AutoStartManager:
         """Disable auto-start on Windows."""
         try:
             import winreg
-            key = winreg.OpenKey(
-                winreg.HKEY_CURRENT_USER,
-                r"Software\Microsoft\Windows\CurrentVersion\Run",
-                0,
-                winreg.KEY_WRITE
-            )
-            try:
-                winreg.DeleteValue(key, self.app_name)
-            except FileNotFoundError:
-                pass
-            winreg.CloseKey(key)
+            with winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER, _WINDOWS_RUN_KEY, 0, winreg.KEY_WRITE
+            ) as key:
+                try:
+                    winreg.DeleteValue(key, self.app_name)
+                except FileNotFoundError:
+                    pass
             return True
         except Exception:
             return False
@@ -149,39 +165,21 @@ class AutoStartManager:
             plist_path = self._get_macos_plist_path()
             plist_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Get executable path
-            if getattr(sys, 'frozen', False):
-                exe_path = sys.executable
-            else:
-                exe_path = sys.executable
-                script_path = os.path.abspath(sys.argv[0])
-
-            # Create plist content
-            plist_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>com.fileseekr.app</string>
-    <key>ProgramArguments</key>
-    <array>
-        <string>{exe_path}</string>
-"""
+            # Get program arguments
+            program_args = [sys.executable]
             if not getattr(sys, 'frozen', False):
-                plist_content += f"        <string>{script_path}</string>\n"
-
-            plist_content += """    </array>
-    <key>RunAtLoad</key>
-    <true/>
-    <key>KeepAlive</key>
-    <false/>
-</dict>
-</plist>
-"""
+                program_args.append(os.path.abspath(sys.argv[0]))
+
+            plist = {
+                'Label': 'com.fileseekr.app',
+                'ProgramArguments': program_args,
+                'RunAtLoad': True,
+                'KeepAlive': False,
+            }
 
             # Write plist file
-            with open(plist_path, 'w') as f:
-                f.write(plist_content)
+            with open(plist_path, 'wb') as f:
+                plistlib.dump(plist, f)
 
             return True
         except Exception as e:
@@ -225,24 +223,9 @@ class AutoStartManager:
             else:
                 exe_path = f"{sys.executable} {os.path.abspath(sys.argv[0])}"
 
-            # Create desktop entry
-            desktop_content = f"""[Desktop Entry]
-Type=Application
-Name=FileSeekr
-Comment=Smart file search application
-Exec={exe_path}
-Icon=system-search
-Terminal=false
-Categories=Utility;
-X-GNOME-Autostart-enabled=true
-"""
-
-            # Write desktop file
-            with open(desktop_file, 'w') as f:
-                f.write(desktop_content)
-
-            # Make executable
-            os.chmod(desktop_file, 0o755)
+            # Write desktop file and make it executable
+            desktop_file.write_text(_LINUX_DESKTOP_TEMPLATE.format(exec_path=exe_path))
+            desktop_file.chmod(0o755)
 
             return True
         except Exception as e:
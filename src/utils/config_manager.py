@@ -1,8 +1,20 @@
 """Configuration management for FileSeekr."""
+import copy
+import hashlib
 import os
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Callable, Set
+
+# Use libyaml's C loader and dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+
+# Marks keys that are absent from the configuration in the lookup cache
+_MISSING = object()
 
 
 class ConfigManager:
@@ -18,6 +30,15 @@ class ConfigManager:
             'excluded_extensions': ['.pyc', '.pyo', '.so', '.dylib', '.dll'],
             'max_file_size_mb': 100,
             'watch_for_changes': True,
+            'checksum_binary': False,  # Hash non-text files too (reads them in full)
+            'watch_batch': {
+                'max_batch': 256,
+                'debounce_ms': 500,
+            },
+            'writer': {
+                'limitmb': 256,  # Per writer process
+                'procs': 4,  # 0 = one per CPU
+            },
         },
         'search': {
             'max_results': 100,
@@ -46,8 +67,18 @@ class ConfigManager:
             config_path: Path to configuration file
         """
         self.config_path = Path(config_path)
+
+        # Digest of what save_config last wrote, to skip identical rewrites
+        self._saved_digest = None
+
         self.config = self._load_config()
 
+        # Resolved dot-path lookups; cleared whenever the config changes
+        self._cache: Dict[str, Any] = {}
+
+        # Called with the set of key paths whose values changed
+        self._listeners: List[Callable[[Set[str]], None]] = []
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default.
 
@@ -57,17 +88,17 @@ class ConfigManager:
         if self.config_path.exists() and self.config_path.stat().st_size > 0:
             try:
                 with open(self.config_path, 'r') as f:
-                    user_config = yaml.safe_load(f) or {}
+                    user_config = yaml.load(f, Loader=_Loader) or {}
                 # Merge with defaults
-                config = self._deep_merge(self.DEFAULT_CONFIG.copy(), user_config)
+                config = self._deep_merge(copy.deepcopy(self.DEFAULT_CONFIG), user_config)
                 return config
             except Exception as e:
                 print(f"Error loading config: {e}. Using defaults.")
-                return self.DEFAULT_CONFIG.copy()
+                return copy.deepcopy(self.DEFAULT_CONFIG)
         else:
             # Create default config file
             self.save_config(self.DEFAULT_CONFIG)
-            return self.DEFAULT_CONFIG.copy()
+            return copy.deepcopy(self.DEFAULT_CONFIG)
 
     def _deep_merge(self, base: Dict, override: Dict) -> Dict:
         """Deep merge two dictionaries.
@@ -96,8 +127,23 @@ class ConfigManager:
         if config is None:
             config = self.config
 
-        with open(self.config_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, indent=2)
+        data = yaml.dump(
+            config, Dumper=_Dumper, default_flow_style=False, indent=2
+        ).encode('utf-8')
+        digest = hashlib.blake2b(data).digest()
+        if digest == self._saved_digest and self.config_path.exists():
+            return
+
+        # Write a temporary file and swap it in, so a crash mid-write can't
+        # leave a truncated config behind; sync it first, or a power loss
+        # after the rename can still leave an empty file
+        tmp_path = self.config_path.with_name(self.config_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.config_path)
+        self._saved_digest = digest
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value by dot-separated path.
@@ -109,14 +155,30 @@ class ConfigManager:
         Returns:
             Configuration value
         """
-        keys = key_path.split('.')
+        try:
+            value = self._cache[key_path]
+        except KeyError:
+            value = self._resolve(key_path)
+            self._cache[key_path] = value
+
+        return default if value is _MISSING else value
+
+    def _resolve(self, key_path: str) -> Any:
+        """Walk the nested config for a dot-separated path.
+
+        Args:
+            key_path: Dot-separated key path
+
+        Returns:
+            Configuration value, or _MISSING if not found
+        """
         value = self.config
 
-        for key in keys:
+        for key in key_path.split('.'):
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
-                return default
+                return _MISSING
 
         return value
 
@@ -127,6 +189,60 @@ class ConfigManager:
             key_path: Dot-separated key path (e.g., 'index.index_path')
             value: Value to set
         """
+        self.update({key_path: value})
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """Set several configuration values and save once.
+
+        Listeners are notified once with the paths whose values changed.
+
+        Args:
+            values: Dictionary of dot-separated key path to value
+        """
+        changed = {
+            key_path for key_path, value in values.items()
+            if self._set_value(key_path, value)
+        }
+        self.save_config()
+
+        if changed:
+            for listener in list(self._listeners):
+                try:
+                    listener(changed)
+                except Exception as e:
+                    print(f"Error in config listener: {e}")
+
+    def add_listener(self, callback: Callable[[Set[str]], None]) -> None:
+        """Register a callback for configuration changes.
+
+        Args:
+            callback: Called with the set of changed key paths
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[Set[str]], None]) -> None:
+        """Unregister a configuration change callback.
+
+        Args:
+            callback: Previously registered callback
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _set_value(self, key_path: str, value: Any) -> bool:
+        """Set a value in memory without saving.
+
+        Args:
+            key_path: Dot-separated key path
+            value: Value to set
+
+        Returns:
+            True if the value changed
+        """
+        old = self._resolve(key_path)
+        if old is not _MISSING and old == value:
+            return False
+
         keys = key_path.split('.')
         config = self.config
 
@@ -136,7 +252,23 @@ class ConfigManager:
             config = config[key]
 
         config[keys[-1]] = value
-        self.save_config()
+        self._invalidate(key_path)
+        return True
+
+    def _invalidate(self, key_path: str) -> None:
+        """Drop cached lookups affected by a change at a path.
+
+        Only the path itself, its parents and its children can change;
+        lookups elsewhere stay cached.
+
+        Args:
+            key_path: Dot-separated key path that was set
+        """
+        prefix = key_path + '.'
+        for cached in list(self._cache):
+            if (cached == key_path or cached.startswith(prefix)
+                    or key_path.startswith(cached + '.')):
+                del self._cache[cached]
 
     def add_watch_path(self, path: str) -> None:
         """Add a path to watch for indexing.
@@ -146,8 +278,7 @@ class ConfigManager:
         """
         watch_paths = self.get('indexing.watch_paths', [])
         if path not in watch_paths:
-            watch_paths.append(path)
-            self.set('indexing.watch_paths', watch_paths)
+            self.set('indexing.watch_paths', watch_paths + [path])
 
     def remove_watch_path(self, path: str) -> None:
         """Remove a path from watch list.
@@ -157,5 +288,4 @@ class ConfigManager:
         """
         watch_paths = self.get('indexing.watch_paths', [])
         if path in watch_paths:
-            watch_paths.remove(path)
-            self.set('indexing.watch_paths', watch_paths)
+            self.set('indexing.watch_paths', [p for p in watch_paths if p != path])
@@ -1,7 +1,5 @@
 """Global hotkey manager for FileSeekr."""
-from pynput import keyboard
-from pynput.keyboard import Key, KeyCode
-from typing import Callable, Set, Optional
+from typing import Callable, Optional
 import threading
 
 
@@ -15,19 +13,30 @@ class HotkeyManager:
             hotkey_callback: Function to call when hotkey is pressed
         """
         self.hotkey_callback = hotkey_callback
+        self._callback = hotkey_callback
         self.listener = None
-        self.current_keys: Set = set()
 
-        # Default hotkey: Ctrl+Shift+F, S (press in sequence)
-        # Or you can use Ctrl+Shift+Space for instant trigger
-        self.hotkey_combo = {
-            Key.ctrl_l, Key.shift, KeyCode.from_char('f')
-        }
+        # Set by the listener when a hotkey fires; a worker thread waits on
+        # it and runs the callback, so the listener never blocks
+        self._trigger = None
 
-        # Alternative: Ctrl+Shift+Space (easier to press)
-        self.simple_hotkey = {
-            Key.ctrl_l, Key.shift, Key.space
-        }
+        # Hotkey combos; built by start(), which is where pynput (and, on
+        # Linux, its display connection) is first loaded
+        self.hotkey_combo = None
+        self.simple_hotkey = None
+
+        # Pressed keys are tracked as bits of an int; only keys that can
+        # complete a hotkey get a bit, everything else typed is ignored.
+        # Filled in by start() once the listener can canonicalize keys.
+        self._canonical = None
+        self._bit = {}
+        self._combo_mask = 0
+        self._simple_mask = 0
+        self._mask = 0
+
+        # Detection errors already reported; a stuck or malformed key can
+        # repeat the same error on every event
+        self._reported_errors = set()
 
         self.running = False
 
@@ -36,19 +45,82 @@ class HotkeyManager:
         if self.running:
             return
 
+        from pynput import keyboard
+
+        if self.hotkey_combo is None:
+            self._build_combos()
+
         self.running = True
+        self._callback = self.hotkey_callback
+        self._trigger = threading.Event()
+        threading.Thread(
+            target=self._run_callbacks,
+            args=(self._trigger,),
+            daemon=True
+        ).start()
+
         self.listener = keyboard.Listener(
             on_press=self._on_press,
             on_release=self._on_release
         )
+
+        # The listener folds left/right modifiers and letter case, so keys
+        # are compared in its canonical form
+        self._canonical = self.listener.canonical
+        self._bit = {}
+        for key in self.hotkey_combo | self.simple_hotkey:
+            self._bit.setdefault(self._canonical(key), 1 << len(self._bit))
+        self._combo_mask = self._mask_of(self.hotkey_combo)
+        self._simple_mask = self._mask_of(self.simple_hotkey)
+        self._mask = 0
+
         self.listener.start()
 
+    def _build_combos(self):
+        """Define the hotkey combinations."""
+        from pynput.keyboard import Key, KeyCode
+
+        # Default hotkey: Ctrl+Shift+F, S (press in sequence)
+        # Or you can use Ctrl+Shift+Space for instant trigger
+        self.hotkey_combo = frozenset({
+            Key.ctrl_l, Key.shift, KeyCode.from_char('f')
+        })
+
+        # Alternative: Ctrl+Shift+Space (easier to press)
+        self.simple_hotkey = frozenset({
+            Key.ctrl_l, Key.shift, Key.space
+        })
+
     def stop(self):
         """Stop listening for global hotkeys."""
         self.running = False
         if self.listener:
             self.listener.stop()
 
+        # Wake the worker so it sees it has been replaced and exits
+        trigger, self._trigger = self._trigger, None
+        if trigger:
+            trigger.set()
+
+    def _run_callbacks(self, trigger: threading.Event):
+        """Run the hotkey callback each time the trigger is set.
+
+        Args:
+            trigger: Event this worker waits on
+        """
+        while True:
+            trigger.wait()
+            trigger.clear()
+            if self._trigger is not trigger:
+                return
+
+            callback = self._callback
+            if callback:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"Error in hotkey callback: {e}")
+
     def _on_press(self, key):
         """Handle key press.
 
@@ -56,24 +128,26 @@ class HotkeyManager:
             key: Pressed key
         """
         try:
-            # Normalize key (handle both left and right modifiers)
-            normalized_key = self._normalize_key(key)
-            self.current_keys.add(normalized_key)
+            bit = self._bit.get(self._canonical(key))
+            if not bit:
+                return
+            self._mask |= bit
 
             # Check if hotkey combination is pressed
             if self._check_hotkey():
-                if self.hotkey_callback:
-                    # Run callback in separate thread to avoid blocking
-                    threading.Thread(
-                        target=self.hotkey_callback,
-                        daemon=True
-                    ).start()
+                # Hand off to the worker thread to avoid blocking
+                trigger = self._trigger
+                if trigger:
+                    trigger.set()
 
                 # Clear keys to prevent repeated triggers
-                self.current_keys.clear()
+                self._mask = 0
 
         except Exception as e:
-            print(f"Error in hotkey detection: {e}")
+            message = repr(e)
+            if message not in self._reported_errors:
+                self._reported_errors.add(message)
+                print(f"Error in hotkey detection: {e}")
 
     def _on_release(self, key):
         """Handle key release.
@@ -81,29 +155,8 @@ class HotkeyManager:
         Args:
             key: Released key
         """
-        try:
-            normalized_key = self._normalize_key(key)
-            self.current_keys.discard(normalized_key)
-        except Exception:
-            pass
-
-    def _normalize_key(self, key):
-        """Normalize key to handle left/right modifiers.
-
-        Args:
-            key: Key to normalize
-
-        Returns:
-            Normalized key
-        """
-        # Normalize left/right modifiers
-        if key in (Key.ctrl_l, Key.ctrl_r):
-            return Key.ctrl_l
-        elif key in (Key.shift_l, Key.shift_r):
-            return Key.shift
-        elif key in (Key.alt_l, Key.alt_r):
-            return Key.alt
-        return key
+        # Unknown keys (even None) canonicalize to themselves and have no bit
+        self._mask &= ~self._bit.get(self._canonical(key), 0)
 
     def _check_hotkey(self) -> bool:
         """Check if current keys match hotkey combination.
@@ -111,16 +164,27 @@ class HotkeyManager:
         Returns:
             True if hotkey is pressed
         """
-        # Check simple hotkey (Ctrl+Shift+Space)
-        if self.simple_hotkey.issubset(self.current_keys):
-            return True
+        mask = self._mask
+
+        # Check simple hotkey (Ctrl+Shift+Space), then Ctrl+Shift+F
+        return (
+            (mask & self._simple_mask) == self._simple_mask
+            or (mask & self._combo_mask) == self._combo_mask
+        )
 
-        # Check complex hotkey (Ctrl+Shift+F)
-        # Note: For sequence-based hotkeys, you might want a more complex implementation
-        if self.hotkey_combo.issubset(self.current_keys):
-            return True
+    def _mask_of(self, keys) -> int:
+        """Combine the bits of a set of keys.
 
-        return False
+        Args:
+            keys: Keys, in any form
+
+        Returns:
+            Bitmask with each key's bit set
+        """
+        mask = 0
+        for key in keys:
+            mask |= self._bit[self._canonical(key)]
+        return mask
 
     def set_callback(self, callback: Callable):
         """Set hotkey callback function.
@@ -129,6 +193,7 @@ class HotkeyManager:
             callback: Function to call when hotkey is pressed
         """
         self.hotkey_callback = callback
+        self._callback = callback
 
     def get_hotkey_description(self) -> str:
         """Get human-readable hotkey description.
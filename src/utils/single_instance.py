@@ -0,0 +1,103 @@
+"""Single-instance guard for the system tray application."""
+from typing import Callable, Optional
+
+from PyQt5.QtCore import QSharedMemory
+from PyQt5.QtNetwork import QLocalServer, QLocalSocket
+
+
+class SingleInstance:
+    """Ensures only one tray instance runs and forwards requests to it."""
+
+    SHOW_MESSAGE = b"show"
+
+    def __init__(self, key: str = "FileSeekr-singleton"):
+        """Initialize single-instance guard.
+
+        Args:
+            key: System-wide key shared by all instances
+        """
+        self.key = key
+        self.shared_memory = QSharedMemory(key)
+        self.server: Optional[QLocalServer] = None
+        self.show_callback: Optional[Callable] = None
+
+    def acquire(self) -> bool:
+        """Try to become the running instance.
+
+        Returns:
+            True if this is the only instance
+        """
+        # On Unix a crashed instance leaves its segment behind; attaching and
+        # detaching again destroys it if nobody else holds it
+        if self.shared_memory.attach():
+            self.shared_memory.detach()
+
+        if self.shared_memory.create(1):
+            return True
+
+        if self.shared_memory.error() == QSharedMemory.AlreadyExists:
+            return False
+
+        return True  # Allow running if shared memory is unavailable
+
+    def listen(self, show_callback: Callable) -> None:
+        """Accept "show" requests from instances launched later.
+
+        Args:
+            show_callback: Function to call when another launch asks to show
+        """
+        self.show_callback = show_callback
+
+        # Remove a stale socket left behind by a crashed instance
+        QLocalServer.removeServer(self.key)
+
+        self.server = QLocalServer()
+        self.server.newConnection.connect(self._on_new_connection)
+        if not self.server.listen(self.key):
+            print(f"Warning: cannot listen for other instances: {self.server.errorString()}")
+
+    def notify_running(self, timeout_ms: int = 500) -> bool:
+        """Ask the running instance to show its search overlay.
+
+        Args:
+            timeout_ms: Connection timeout in milliseconds
+
+        Returns:
+            True if the request was delivered
+        """
+        socket = QLocalSocket()
+        socket.connectToServer(self.key)
+        if not socket.waitForConnected(timeout_ms):
+            return False
+
+        socket.write(self.SHOW_MESSAGE)
+        delivered = socket.waitForBytesWritten(timeout_ms)
+        socket.disconnectFromServer()
+        return delivered
+
+    def release(self) -> None:
+        """Give up the instance lock."""
+        if self.server is not None:
+            self.server.close()
+            self.server = None
+        if self.shared_memory.isAttached():
+            self.shared_memory.detach()
+
+    def _on_new_connection(self):
+        """Handle a connection from another instance."""
+        socket = self.server.nextPendingConnection()
+        if socket is None:
+            return
+
+        socket.readyRead.connect(lambda: self._on_message(socket))
+        socket.disconnected.connect(socket.deleteLater)
+
+    def _on_message(self, socket: QLocalSocket):
+        """Handle a message from another instance.
+
+        Args:
+            socket: Connected socket
+        """
+        message = bytes(socket.readAll()).strip()
+        if message == self.SHOW_MESSAGE and self.show_callback:
+            self.show_callback()
@@ -0,0 +1,6 @@
+"""Shared pytest setup."""
+from pathlib import Path
+import sys
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
@@ -0,0 +1,67 @@
+"""Tests for AppController."""
+import threading
+
+import pytest
+
+from src.app_controller import AppController
+
+
+@pytest.fixture
+def controller(tmp_path, monkeypatch):
+    """Controller with its config and index under a temporary directory."""
+    monkeypatch.chdir(tmp_path)
+    controller = AppController(str(tmp_path / 'config.yaml'))
+    yield controller
+    controller.shutdown()
+
+
+def _update(controller, values):
+    """Update the config and wait for the watcher to be reconfigured."""
+    controller.config.update(values)
+    controller._watcher_thread.join()
+
+
+class TestAppController:
+    """Test suite for AppController."""
+
+    def test_exclusion_change_reaches_watcher(self, controller):
+        """Test that changing an exclusion through the config updates the watcher."""
+        excluded = controller.config.get('index.excluded_dirs') + ['vendor']
+
+        _update(controller, {'index.excluded_dirs': excluded})
+
+        assert 'vendor' in controller.file_watcher._excluded_dirs
+
+    def test_watch_paths_change_reaches_watcher(self, controller, tmp_path):
+        """Test that watch paths saved by the settings dialog are watched."""
+        first = tmp_path / 'first'
+        second = tmp_path / 'second'
+        first.mkdir()
+        second.mkdir()
+
+        _update(controller, {'indexing.watch_paths': [str(first), str(second)]})
+        assert controller.file_watcher.watch_paths == {first, second}
+        assert controller.file_watcher.running
+
+        _update(controller, {'indexing.watch_paths': [str(second)]})
+        assert controller.file_watcher.watch_paths == {second}
+
+    def test_watch_for_changes_toggles_watcher(self, controller):
+        """Test that turning change watching off and on again replaces the watcher."""
+        _update(controller, {'index.watch_for_changes': False})
+        assert controller.file_watcher is None
+
+        _update(controller, {'index.watch_for_changes': True})
+        assert controller.file_watcher is not None
+
+    def test_watcher_reconfigured_off_calling_thread(self, controller, monkeypatch):
+        """Test that saving settings doesn't wait for the watcher to stop."""
+        release = threading.Event()
+        monkeypatch.setattr(controller.file_watcher, 'stop', lambda: release.wait(5))
+
+        controller.config.update({'index.watch_for_changes': False})
+        assert controller._watcher_thread.is_alive()
+
+        release.set()
+        controller._watcher_thread.join()
+        assert controller.file_watcher is None
@@ -1,72 +1,96 @@
 """Tests for ConfigManager."""
 import pytest
-import tempfile
 import os
-from pathlib import Path
-import sys
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from src.utils.config_manager import ConfigManager
 
 
+@pytest.fixture
+def config_path(tmp_path):
+    """Path of a config file in a fresh directory."""
+    return tmp_path / 'config.yaml'
+
+
+@pytest.fixture
+def config(config_path):
+    """ConfigManager backed by a fresh config file."""
+    return ConfigManager(str(config_path))
+
+
 class TestConfigManager:
     """Test suite for ConfigManager."""
 
-    def test_default_config_creation(self):
+    def test_default_config_creation(self, config, config_path):
         """Test that default config is created."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / 'config.yaml'
-            config = ConfigManager(str(config_path))
-
-            assert config_path.exists()
-            assert config.get('index.index_path') == 'data/index'
+        assert config_path.exists()
+        assert config.get('index.index_path') == 'data/index'
 
-    def test_get_nested_value(self):
+    def test_get_nested_value(self, config):
         """Test getting nested configuration values."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / 'config.yaml'
-            config = ConfigManager(str(config_path))
+        value = config.get('index.max_file_size_mb')
+        assert value == 100
 
-            value = config.get('index.max_file_size_mb')
-            assert value == 100
-
-    def test_set_nested_value(self):
+    def test_set_nested_value(self, config):
         """Test setting nested configuration values."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / 'config.yaml'
-            config = ConfigManager(str(config_path))
-
-            config.set('index.max_file_size_mb', 200)
-            assert config.get('index.max_file_size_mb') == 200
+        config.set('index.max_file_size_mb', 200)
+        assert config.get('index.max_file_size_mb') == 200
 
-    def test_add_watch_path(self):
+    def test_add_watch_path(self, config):
         """Test adding watch paths."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / 'config.yaml'
-            config = ConfigManager(str(config_path))
-
-            config.add_watch_path('/test/path')
-            paths = config.get('indexing.watch_paths')
-            assert '/test/path' in paths
+        config.add_watch_path('/test/path')
+        paths = config.get('indexing.watch_paths')
+        assert '/test/path' in paths
 
-    def test_remove_watch_path(self):
+    def test_remove_watch_path(self, config):
         """Test removing watch paths."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / 'config.yaml'
-            config = ConfigManager(str(config_path))
+        config.add_watch_path('/test/path')
+        config.remove_watch_path('/test/path')
+        paths = config.get('indexing.watch_paths')
+        assert '/test/path' not in paths
 
-            config.add_watch_path('/test/path')
-            config.remove_watch_path('/test/path')
-            paths = config.get('indexing.watch_paths')
-            assert '/test/path' not in paths
-
-    def test_default_value(self):
+    def test_default_value(self, config):
         """Test getting default value for missing key."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / 'config.yaml'
-            config = ConfigManager(str(config_path))
-
-            value = config.get('nonexistent.key', 'default')
-            assert value == 'default'
+        value = config.get('nonexistent.key', 'default')
+        assert value == 'default'
+
+    def test_set_invalidates_cached_value(self, config):
+        """Test that set() is visible to later get() calls."""
+        assert config.get('search.max_results') == 100
+        config.set('search.max_results', 50)
+        assert config.get('search.max_results') == 50
+        assert config.get('search.missing', 'default') == 'default'
+
+    def test_set_keeps_unrelated_cached_values(self, config):
+        """Test that set() only invalidates the path, its parents and children."""
+        assert config.get('index.watch_batch.max_batch') == 256
+        assert config.get('index')['watch_batch']['debounce_ms'] == 500
+        assert config.get('search.max_results') == 100
+
+        config.set('index.watch_batch', {'max_batch': 8})
+        assert 'search.max_results' in config._cache
+        assert config.get('index.watch_batch.max_batch') == 8
+        assert config.get('index.watch_batch.debounce_ms') is None
+        assert config.get('index')['watch_batch'] == {'max_batch': 8}
+
+    def test_update_sets_values_and_saves(self, config, config_path):
+        """Test setting several values in one update."""
+        config.update({'search.max_results': 25, 'ui.theme': 'dark'})
+        assert config.get('search.max_results') == 25
+
+        reloaded = ConfigManager(str(config_path))
+        assert reloaded.get('search.max_results') == 25
+        assert reloaded.get('ui.theme') == 'dark'
+
+    def test_listeners_receive_changed_keys(self, config):
+        """Test that listeners are told only about values that changed."""
+        notifications = []
+        config.add_listener(notifications.append)
+
+        config.update({'search.max_results': 100, 'search.fuzzy_distance': 3})
+        config.set('search.fuzzy_distance', 3)
+        config.add_watch_path('/test/path')
+
+        assert notifications == [
+            {'search.fuzzy_distance'},
+            {'indexing.watch_paths'},
+        ]
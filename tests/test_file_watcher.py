@@ -0,0 +1,42 @@
+"""Tests for FileWatcher."""
+import pytest
+
+from src.utils.config_manager import ConfigManager
+from src.core.indexer import FileIndexer
+from src.core.file_watcher import FileWatcher
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    """Unstarted watcher over a fresh index."""
+    config = ConfigManager(str(tmp_path / 'config.yaml'))
+    index_path = tmp_path / 'index'
+    index_path.mkdir()
+    return FileWatcher(FileIndexer(str(index_path), config), config)
+
+
+class TestFileWatcher:
+    """Test suite for FileWatcher."""
+
+    def test_root_under_excluded_name_is_watched(self, watcher, tmp_path):
+        """Test that only directories below the watch root are matched against exclusions."""
+        root = tmp_path / 'build' / 'proj'
+        (root / 'node_modules').mkdir(parents=True)
+        watcher.add_watch_path(str(root))
+
+        watcher._queue_event('add', str(root / 'a.txt'))
+        watcher._queue_event('add', str(root / 'node_modules' / 'b.txt'))
+
+        assert [path for _, path in watcher._events] == [root / 'a.txt']
+
+    def test_coalesce_drops_file_created_and_deleted(self):
+        """Test that a file added and deleted within a burst is skipped."""
+        p = '/watched/a.txt'
+
+        assert FileWatcher._coalesce([('add', p), ('modify', p), ('delete', p)]) == {}
+
+    def test_coalesce_keeps_delete_of_indexed_file(self):
+        """Test that a delete before an add/delete pair is kept."""
+        p = '/watched/a.txt'
+
+        assert FileWatcher._coalesce([('delete', p), ('add', p), ('delete', p)]) == {p: 'delete'}
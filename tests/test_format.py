@@ -0,0 +1,22 @@
+"""Tests for GUI display formatting."""
+import pytest
+
+from src.gui._format import format_size
+
+
+class TestFormatSize:
+    """Test format_size."""
+
+    @pytest.mark.parametrize('size,expected', [
+        (0, "0.0 B"),
+        (512, "512.0 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (5 * 1024 * 1024, "5.0 MB"),
+        (3 * 1024 ** 4, "3.0 TB"),
+        (2048 * 1024 ** 5, "2048.0 PB"),
+    ])
+    def test_units(self, size, expected):
+        """Test that sizes pick the largest unit below them."""
+        assert format_size(size) == expected
@@ -1,56 +1,61 @@
 """Tests for FileIndexer."""
 import pytest
-import tempfile
 import os
-from pathlib import Path
-import sys
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 
 from src.utils.config_manager import ConfigManager
-from src.core.indexer import FileIndexer
+from src.core.indexer import FileIndexer, extract_document
+
+
+def _write_file(path, data: bytes):
+    """Write bytes to a new file with one open/write/close."""
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="module")
+def config(tmp_path_factory):
+    """Configuration shared by the module's tests; none of them change it."""
+    return ConfigManager(str(tmp_path_factory.mktemp('config') / 'config.yaml'))
 
 
 class TestFileIndexer:
     """Test suite for FileIndexer."""
 
     @pytest.fixture
-    def setup(self):
+    def setup(self, config, tmp_path):
         """Setup test environment."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create config
-            config_path = tmpdir_path / 'config.yaml'
-            config = ConfigManager(str(config_path))
-
-            # Create index directory
-            index_path = tmpdir_path / 'index'
-            index_path.mkdir()
+        # Create index directory
+        index_path = tmp_path / 'index'
+        index_path.mkdir()
 
-            # Create test files
-            test_dir = tmpdir_path / 'test_files'
-            test_dir.mkdir()
+        # Create test files
+        test_dir = tmp_path / 'test_files'
+        test_dir.mkdir()
 
-            (test_dir / 'test1.txt').write_text('Hello World')
-            (test_dir / 'test2.py').write_text('print("test")')
-            (test_dir / 'test3.md').write_text('# Markdown')
+        _write_file(test_dir / 'test1.txt', b'Hello World')
+        _write_file(test_dir / 'test2.py', b'print("test")')
+        _write_file(test_dir / 'test3.md', b'# Markdown')
 
-            # Create subdirectory
-            sub_dir = test_dir / 'subdir'
-            sub_dir.mkdir()
-            (sub_dir / 'test4.txt').write_text('Nested file')
+        # Create subdirectory
+        sub_dir = test_dir / 'subdir'
+        sub_dir.mkdir()
+        _write_file(sub_dir / 'test4.txt', b'Nested file')
 
-            # Create indexer
-            indexer = FileIndexer(str(index_path), config)
+        # Create indexer
+        indexer = FileIndexer(str(index_path), config)
 
-            yield {
-                'tmpdir': tmpdir_path,
-                'config': config,
-                'indexer': indexer,
-                'test_dir': test_dir,
-            }
+        return {
+            'tmpdir': tmp_path,
+            'config': config,
+            'indexer': indexer,
+            'test_dir': test_dir,
+        }
 
     def test_index_directory(self, setup):
         """Test indexing a directory."""
@@ -83,3 +88,126 @@ class TestFileIndexer:
 
         stats = indexer.get_index_stats()
         assert stats['document_count'] == 0
+
+    def test_update_files(self, setup):
+        """Test batched updates and removals in one transaction."""
+        indexer = setup['indexer']
+        test_dir = setup['test_dir']
+
+        indexer.index_directory(str(test_dir))
+        new_file = test_dir / 'test5.txt'
+        new_file.write_text('Batched file')
+
+        indexed = indexer.update_files(
+            [new_file],
+            removed_paths=[test_dir / 'test1.txt']
+        )
+
+        assert indexed == [new_file]
+        with indexer.ix.searcher() as searcher:
+            assert searcher.document(path=str(new_file)) is not None
+            assert searcher.document(path=str(test_dir / 'test1.txt')) is None
+
+    def test_update_files_with_process_pool(self, setup):
+        """Test that files read in worker processes are indexed."""
+        indexer = setup['indexer']
+        test_dir = setup['test_dir']
+        paths = [test_dir / 'test1.txt', test_dir / 'test2.py']
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            indexed = indexer.update_files(paths, executor=executor)
+
+        assert indexed == paths
+        with indexer.ix.searcher() as searcher:
+            doc = searcher.document(path=str(test_dir / 'test2.py'))
+            assert doc['filename'] == 'test2.py'
+
+    def test_reindex_skips_unchanged_files(self, setup):
+        """Test that reindexing only reads files that changed."""
+        indexer = setup['indexer']
+        test_dir = setup['test_dir']
+
+        first = indexer.index_directory(str(test_dir))
+        (test_dir / 'test5.txt').write_text('New file')
+        second = indexer.index_directory(str(test_dir))
+
+        assert second['indexed'] == 1
+        assert second['skipped'] == first['indexed']
+
+    def test_index_directory_isolates_bad_files(self, setup, monkeypatch):
+        """Test that a file failing to convert is counted, not fatal."""
+        indexer = setup['indexer']
+        bad_path = str(setup['test_dir'] / 'test2.py')
+
+        def extract(file_path, *args, **kwargs):
+            if file_path == bad_path:
+                raise ValueError("year 60000 is out of range")
+            return extract_document(file_path, *args, **kwargs)
+
+        monkeypatch.setattr('src.core.indexer.extract_document', extract)
+        stats = indexer.index_directory(str(setup['test_dir']))
+
+        assert stats['errors'] == 1
+        assert stats['indexed'] == 3
+        assert indexer.ix.doc_count() == 3
+
+    def test_indexed_state_reads_columns(self, setup):
+        """Test that the reindex check gets size and mtime from the columns."""
+        indexer = setup['indexer']
+        test_file = setup['test_dir'] / 'test1.txt'
+
+        indexer.index_directory(str(setup['test_dir']))
+        with indexer.ix.searcher() as searcher:
+            assert searcher.reader().has_column('modified')
+
+        stat = test_file.stat()
+        assert indexer._indexed_state()[str(test_file)] == (
+            stat.st_size, datetime.fromtimestamp(stat.st_mtime)
+        )
+
+    def test_index_overlapping_directories(self, setup):
+        """Test that files under nested roots are indexed once."""
+        indexer = setup['indexer']
+        test_dir = setup['test_dir']
+        subdir = test_dir / 'sub'
+        subdir.mkdir()
+        (subdir / 'nested.txt').write_text('Nested file')
+
+        stats = indexer.index_directories([str(test_dir), str(subdir)])
+
+        assert stats['indexed'] == indexer.ix.doc_count()
+        with indexer.ix.searcher() as searcher:
+            assert searcher.document(path=str(subdir / 'nested.txt')) is not None
+
+    def test_incremental_reindex_removes_deleted_files(self, setup):
+        """Test that an incremental reindex drops files deleted from disk."""
+        indexer = setup['indexer']
+        test_dir = setup['test_dir']
+
+        indexer.index_directory(str(test_dir))
+        (test_dir / 'test1.txt').unlink()
+        indexer.index_directories([str(test_dir)], remove_missing=True)
+
+        with indexer.ix.searcher() as searcher:
+            assert searcher.document(path=str(test_dir / 'test1.txt')) is None
+            assert searcher.document(path=str(test_dir / 'test2.py')) is not None
+
+    def test_index_directories_cancelled(self, setup):
+        """Test that a set cancel event stops indexing."""
+        indexer = setup['indexer']
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        stats = indexer.index_directories([str(setup['test_dir'])], cancel_event=cancel_event)
+
+        assert stats['indexed'] == 0
+        assert indexer.ix.doc_count() == 0
+
+    def test_collect_files_cancelled(self, setup):
+        """Test that a set cancel event stops the directory walk."""
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        paths, _ = setup['indexer']._collect_files([str(setup['test_dir'])], cancel_event)
+
+        assert paths == []
@@ -1,53 +1,41 @@
 """Tests for NLPQueryParser."""
 import pytest
-from pathlib import Path
-import sys
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from src.core.nlp_parser import NLPQueryParser
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """Create one parser instance, so its model loads once per module."""
+    return NLPQueryParser()
+
+
 class TestNLPQueryParser:
     """Test suite for NLPQueryParser."""
 
-    @pytest.fixture
-    def parser(self):
-        """Create parser instance."""
-        return NLPQueryParser()
-
     def test_basic_query(self, parser):
         """Test basic query parsing."""
         result = parser.parse("test query")
         assert result['query'] == "test query"
         assert isinstance(result['filters'], dict)
 
-    def test_filetype_extraction(self, parser):
-        """Test file type extraction."""
-        result = parser.parse("find image files")
-        assert result['filters'].get('filetype') == 'image'
-
-    def test_extension_extraction(self, parser):
-        """Test extension extraction."""
-        result = parser.parse("search for .py files")
-        assert result['filters'].get('extension') == 'py'
-
-    def test_extension_with_prefix(self, parser):
-        """Test extension with ext: prefix."""
-        result = parser.parse("ext:pdf documents")
-        assert result['filters'].get('extension') == 'pdf'
+    @pytest.mark.parametrize("query,expected", [
+        ("find image files", {'filetype': 'image'}),
+        ("search for .py files", {'extension': 'py'}),
+        ("ext:pdf documents", {'extension': 'pdf'}),
+        ("in:/home/user documents", {'directory': '/home/user'}),
+    ], ids=["filetype", "extension", "extension_with_prefix", "directory"])
+    def test_filter_extraction(self, parser, query, expected):
+        """Test extracting a filter from a query."""
+        filters = parser.parse(query)['filters']
+        for key, value in expected.items():
+            assert filters.get(key) == value
 
     def test_size_keyword(self, parser):
         """Test size keyword extraction."""
         result = parser.parse("large files")
         assert 'size_min' in result['filters']
 
-    def test_directory_extraction(self, parser):
-        """Test directory extraction."""
-        result = parser.parse("in:/home/user documents")
-        assert result['filters'].get('directory') == '/home/user'
-
     def test_multiple_filters(self, parser):
         """Test parsing multiple filters."""
         result = parser.parse("large image files ext:jpg")
@@ -60,3 +48,12 @@ class TestNLPQueryParser:
         result = parser.parse("")
         assert result['query'] == ''
         assert result['filters'] == {}
+
+    def test_repeated_parse_returns_fresh_results(self, parser):
+        """Test that cached parses are not shared between callers."""
+        first = parser.parse("image files modified today")
+        first['filters']['filetype'] = 'video'
+
+        second = parser.parse("image files modified today")
+        assert second['filters']['filetype'] == 'image'
+        assert second['filters']['modified_after'] >= first['filters']['modified_after']
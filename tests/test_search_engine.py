@@ -0,0 +1,47 @@
+"""Tests for SearchEngine."""
+import pytest
+from datetime import datetime, timedelta
+
+from src.utils.config_manager import ConfigManager
+from src.core.indexer import FileIndexer
+from src.core.search_engine import SearchEngine
+
+
+class TestSearchEngine:
+    """Test suite for SearchEngine."""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        """Create a search engine over an empty index."""
+        config = ConfigManager(str(tmp_path / 'config.yaml'))
+        index_path = tmp_path / 'index'
+        index_path.mkdir()
+        indexer = FileIndexer(str(index_path), config)
+        engine = SearchEngine(indexer, config)
+        yield engine
+        engine.close()
+
+    def test_build_query_cache_ignores_unused_filters(self, engine):
+        """Filters the query builder doesn't read don't miss its cache."""
+        for days in (1, 2, 3):
+            engine._build_query('report', {
+                'filetype': 'document',
+                'modified_after': datetime.now() - timedelta(days=days),
+            })
+
+        info = engine._build_query_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_result_cache_key_truncates_relative_dates(self, engine):
+        """Relative dates computed moments apart share a result cache key."""
+        now = datetime(2024, 5, 10, 12, 0, 0)
+        first = engine._result_filter_key({'modified_after': now - timedelta(days=7)})
+        second = engine._result_filter_key(
+            {'modified_after': now + timedelta(seconds=5) - timedelta(days=7)}
+        )
+
+        assert first == second
+        assert first != engine._result_filter_key(
+            {'modified_after': now - timedelta(days=8)}
+        )